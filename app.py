@@ -8,9 +8,15 @@ import os
 import io
 from pathlib import Path
 from flask import Flask, render_template_string, jsonify, request, send_file
+import numpy as np
 import pandas as pd
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ==================== CONFIGURATION ====================
 BASE_PATH = Path(__file__).parent
 EXCEL_FILE = BASE_PATH / "Sentiment_Analysis_Production.xlsx"
@@ -51,12 +57,68 @@ TOP_KEYWORDS = {
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
+MONTH_MAP = {'Jan':1, 'Feb':2, 'Mar':3, 'Apr':4, 'May':5, 'Jun':6,
+             'Jul':7, 'Aug':8, 'Sep':9, 'Oct':10, 'Nov':11, 'Dec':12}
+
+# One parsed copy of the workbook, keyed by file mtime so edits are picked up
+_DATA_CACHE = {'mtime': None, 'df': None}
+
+def _data_source():
+    """Pick the Parquet sidecar over the xlsx when it is at least as new.
+
+    The analysis pipeline writes both on every save; the columnar sidecar
+    loads orders of magnitude faster than parsing workbook XML.
+    """
+    parquet = EXCEL_FILE.with_suffix('.parquet')
+    try:
+        if parquet.stat().st_mtime >= EXCEL_FILE.stat().st_mtime:
+            return parquet
+    except OSError:
+        if parquet.exists():
+            return parquet
+    return EXCEL_FILE
+
 def load_sentiment_data():
-    if not EXCEL_FILE.exists():
+    source = _data_source()
+    if not source.exists():
         logger.warning(f"Data file not found: {EXCEL_FILE}")
         return None
     try:
-        return pd.read_excel(EXCEL_FILE, sheet_name='Quarterly Sentiment')
+        mtime = source.stat().st_mtime
+        if _DATA_CACHE['mtime'] == mtime:
+            return _DATA_CACHE['df']
+        if source.suffix == '.parquet':
+            df = pd.read_parquet(source)
+        else:
+            df = pd.read_excel(source, sheet_name='Quarterly Sentiment')
+        # Pre-compute the sort key once so per-request helpers skip the map work.
+        # Period is a plain int32 (year*12 + month), so sorts compare integers
+        # instead of concatenated year/month strings.
+        df['Month_Num'] = df['Month'].map(MONTH_MAP).fillna(0).astype('int32')
+        df['Period'] = (df['Year'].astype('int32') * 12 + df['Month_Num']).astype('int32')
+        df['Month'] = pd.Categorical(df['Month'], categories=list(MONTH_MAP) + ['Unknown'], ordered=True)
+        if 'Sentiment_Category' not in df.columns:
+            # Write packed int8 category codes straight into a Categorical;
+            # no per-row label strings are ever materialized
+            scores = df['Overall_Sentiment'].to_numpy()
+            codes = np.ones(len(scores), dtype=np.int8)  # Neutral
+            codes[scores > 0.2] = 2                      # Positive
+            codes[scores < -0.1] = 0                     # Negative
+            df['Sentiment_Category'] = pd.Categorical.from_codes(
+                codes, ['Negative', 'Neutral', 'Positive'])
+        if 'Sector' not in df.columns:
+            df['Sector'] = df['Company'].map(SECTOR_MAPPING).fillna('Unknown')
+        # Ticker-style symbol and keyword tag, vectorized once here so no
+        # request-path loop slices strings again
+        df['Symbol'] = df['Company'].str.slice(0, 3).str.upper()
+        df['TopKeyword'] = df['Company'].map(lambda c: TOP_KEYWORDS.get(c, 'N/A'))
+        # Low-cardinality keys as categoricals: groupby hashes int codes
+        # instead of strings and the frame shrinks accordingly
+        df['Company'] = df['Company'].astype('category')
+        df['Sector'] = df['Sector'].astype('category')
+        _DATA_CACHE['mtime'] = mtime
+        _DATA_CACHE['df'] = df
+        return df
     except Exception as e:
         logger.error(f"Error loading data: {e}")
         return None
@@ -65,70 +127,109 @@ def get_all_data():
     df = load_sentiment_data()
     if df is None or df.empty:
         return None
-    if 'Sector' not in df.columns:
-        df['Sector'] = df['Company'].map(SECTOR_MAPPING).fillna('Unknown')
     return df
 
+# Latest-per-company view, keyed by the same mtime as _DATA_CACHE so the
+# six dashboard helpers share one sort + groupby instead of re-running it
+_LATEST_CACHE = {'mtime': None, 'df': None}
+
 def get_latest_sentiment():
     df = get_all_data()
     if df is None or df.empty:
         return None
-    month_map = {'Jan':1, 'Feb':2, 'Mar':3, 'Apr':4, 'May':5, 'Jun':6,
-                 'Jul':7, 'Aug':8, 'Sep':9, 'Oct':10, 'Nov':11, 'Dec':12}
-    df['Month_Num'] = df['Month'].map(month_map)
-    df['Sort_Date'] = df['Year'].astype(str) + df['Month_Num'].astype(str).str.zfill(2)
-    return df.sort_values('Sort_Date', ascending=False).groupby('Company').first().reset_index()
+    if _LATEST_CACHE['mtime'] == _DATA_CACHE['mtime']:
+        return _LATEST_CACHE['df']
+    # drop_duplicates on the sorted frame is a single hash pass; it takes
+    # each company's newest row whole instead of running per-column
+    # first() aggregation through the groupby machinery
+    latest = (df.sort_values('Period', ascending=False)
+                .drop_duplicates('Company')
+                .reset_index(drop=True))
+    _LATEST_CACHE['mtime'] = _DATA_CACHE['mtime']
+    _LATEST_CACHE['df'] = latest
+    return latest
 
 def get_top_positive(n=5):
     latest = get_latest_sentiment()
     if latest is None:
         return []
     top = latest.nlargest(n, 'Overall_Sentiment')
-    return [{'symbol': row['Company'][:3].upper(), 'name': row['Company'], 
-             'sector': row.get('Sector', 'Unknown'),
-             'score': round(row['Overall_Sentiment'], 2),
-             'keyword': TOP_KEYWORDS.get(row['Company'], 'Strong')} 
-            for _, row in top.iterrows()]
+    return [{'symbol': symbol, 'name': company,
+             'sector': sector,
+             'score': round(score, 2),
+             'keyword': TOP_KEYWORDS.get(company, 'Strong')}
+            for company, symbol, sector, score in zip(top['Company'], top['Symbol'],
+                                                      top['Sector'],
+                                                      top['Overall_Sentiment'])]
 
 def get_top_negative(n=5):
     latest = get_latest_sentiment()
     if latest is None:
         return []
     bottom = latest.nsmallest(n, 'Overall_Sentiment')
-    return [{'symbol': row['Company'][:3].upper(), 'name': row['Company'], 
-             'sector': row.get('Sector', 'Unknown'),
-             'score': round(row['Overall_Sentiment'], 2),
-             'keyword': TOP_KEYWORDS.get(row['Company'], 'Weak')} 
-            for _, row in bottom.iterrows()]
+    return [{'symbol': symbol, 'name': company,
+             'sector': sector,
+             'score': round(score, 2),
+             'keyword': TOP_KEYWORDS.get(company, 'Weak')}
+            for company, symbol, sector, score in zip(bottom['Company'], bottom['Symbol'],
+                                                      bottom['Sector'],
+                                                      bottom['Overall_Sentiment'])]
 
-def get_sector_leaders():
-    latest = get_latest_sentiment()
-    if latest is None:
-        return []
-    sector_avg = latest.groupby('Sector')['Overall_Sentiment'].mean().sort_values(ascending=False)
-    results = []
-    for sector, score in sector_avg.head(5).items():
-        results.append({'sector': sector, 'score': round(score, 2)})
-    return results
+# Derived views (sector aggregates, sorted stock list) rebuilt only when
+# the underlying data version changes
+_VIEW_CACHE = {'mtime': None, 'views': None}
 
-def get_sector_heatmap_data():
-    """Calculate sector-wise sentiment for heatmap with size based on stock count"""
+def _get_views():
     latest = get_latest_sentiment()
     if latest is None:
-        return []
-    sector_data = latest.groupby('Sector').agg({
-        'Overall_Sentiment': 'mean',
-        'Company': 'count'
-    }).reset_index()
-    sector_data.columns = ['sector', 'avg_sentiment', 'count']
+        return None
+    if _VIEW_CACHE['mtime'] == _DATA_CACHE['mtime']:
+        return _VIEW_CACHE['views']
+
+    # One hash partition of Sector feeds both the leaders list and the heatmap
+    sector_data = (latest.groupby('Sector', sort=False, observed=True)
+                   .agg(avg_sentiment=('Overall_Sentiment', 'mean'),
+                        count=('Company', 'count'))
+                   .reset_index()
+                   .rename(columns={'Sector': 'sector'})
+                   .sort_values('avg_sentiment', ascending=False))
     sector_data['avg_sentiment'] = sector_data['avg_sentiment'].round(2)
-    
+
+    leaders = [{'sector': sector, 'score': float(score)}
+               for sector, score in zip(sector_data['sector'].head(5),
+                                        sector_data['avg_sentiment'].head(5))]
+
     # Calculate size ratio based on stock count (for visual sizing)
     max_count = sector_data['count'].max() if len(sector_data) > 0 else 1
     sector_data['size_ratio'] = (sector_data['count'] / max_count * 100).round(0).astype(int)
     sector_data['size_ratio'] = sector_data['size_ratio'].clip(lower=40)  # Minimum 40% size
-    
-    return sector_data.to_dict('records')
+
+    # TopKeyword is already on the frame from the load-time warm-up
+    sorted_stocks = latest.sort_values('Overall_Sentiment', ascending=False).to_dict('records')
+    # NaN -> None once per data version: orjson emits null for NaN natively,
+    # but the stdlib-json fallback would write an invalid bare NaN token
+    for record in sorted_stocks:
+        for key, value in record.items():
+            if isinstance(value, float) and value != value:
+                record[key] = None
+
+    views = {
+        'sector_leaders': leaders,
+        'sector_heatmap': sector_data.to_dict('records'),
+        'sorted_stocks': sorted_stocks,
+    }
+    _VIEW_CACHE['mtime'] = _DATA_CACHE['mtime']
+    _VIEW_CACHE['views'] = views
+    return views
+
+def get_sector_leaders():
+    views = _get_views()
+    return views['sector_leaders'] if views else []
+
+def get_sector_heatmap_data():
+    """Sector-wise sentiment for the heatmap with size based on stock count"""
+    views = _get_views()
+    return views['sector_heatmap'] if views else []
 
 def get_sentiment_distribution():
     """Calculate sentiment distribution for histogram"""
@@ -136,13 +237,14 @@ def get_sentiment_distribution():
     if latest is None:
         return {'buckets': [], 'mean': 0}
     
-    # Create buckets from -1 to +1 in steps of 0.2
+    # Buckets from -1 to +1 in steps of 0.2: one histogram pass instead of
+    # ten boolean range masks over the column
+    scores = latest['Overall_Sentiment'].to_numpy()
+    edges = np.round(np.arange(-1.0, 1.01, 0.2), 1)
+    counts, _ = np.histogram(scores, bins=edges)
+
     buckets = []
-    ranges = [(-1.0, -0.8), (-0.8, -0.6), (-0.6, -0.4), (-0.4, -0.2), (-0.2, 0.0),
-              (0.0, 0.2), (0.2, 0.4), (0.4, 0.6), (0.6, 0.8), (0.8, 1.0)]
-    
-    for low, high in ranges:
-        count = len(latest[(latest['Overall_Sentiment'] >= low) & (latest['Overall_Sentiment'] < high)])
+    for low, high, count in zip(edges[:-1], edges[1:], counts):
         # Determine color based on range
         if high <= -0.5:
             color = 'red'
@@ -154,98 +256,82 @@ def get_sentiment_distribution():
             color = 'teal'
         else:
             color = 'amber'
-        buckets.append({'range': f"{low:.1f} to {high:.1f}", 'count': count, 'low': low, 'high': high, 'color': color})
-    
-    mean_val = latest['Overall_Sentiment'].mean()
-    return {'buckets': buckets, 'mean': round(mean_val, 2)}
+        buckets.append({'range': f"{low:.1f} to {high:.1f}", 'count': int(count),
+                        'low': float(low), 'high': float(high), 'color': color})
+
+    return {'buckets': buckets, 'mean': round(float(scores.mean()), 2)}
 
 def get_summary_stats():
     latest = get_latest_sentiment()
     if latest is None:
         return {'total': 0, 'positive': 0, 'negative': 0, 'neutral': 0, 'avg_score': 0}
     
-    if 'Sentiment_Category' not in latest.columns:
-        latest['Sentiment_Category'] = latest['Overall_Sentiment'].apply(
-            lambda x: 'Positive' if x > 0.2 else ('Negative' if x < -0.1 else 'Neutral'))
-    
-    avg_score = latest['Overall_Sentiment'].mean()
-    
+    vc = latest['Sentiment_Category'].value_counts()
     return {
         'total': len(latest),
-        'positive': len(latest[latest['Sentiment_Category'] == 'Positive']),
-        'negative': len(latest[latest['Sentiment_Category'] == 'Negative']),
-        'neutral': len(latest[latest['Sentiment_Category'] == 'Neutral']),
-        'avg_score': round(avg_score, 2)
+        'positive': int(vc.get('Positive', 0)),
+        'negative': int(vc.get('Negative', 0)),
+        'neutral': int(vc.get('Neutral', 0)),
+        'avg_score': round(float(latest['Overall_Sentiment'].mean()), 2)
     }
 
+# Mood thresholds as a sorted bin table; searchsorted picks the label in
+# one lookup and the same bins vectorize over whole score arrays if needed
+_MOOD_BINS = np.array([-0.5, -0.2, 0.2, 0.5])
+_MOOD_LABELS = [('Extreme Fear', 'red'), ('Fear', 'red'), ('Neutral', 'amber'),
+                ('Greed', 'emerald'), ('Extreme Greed', 'emerald')]
+
 def get_market_mood(avg_score):
-    if avg_score >= 0.5:
-        return 'Extreme Greed', 'emerald'
-    elif avg_score >= 0.2:
-        return 'Greed', 'emerald'
-    elif avg_score >= -0.2:
-        return 'Neutral', 'amber'
-    elif avg_score >= -0.5:
-        return 'Fear', 'red'
-    else:
-        return 'Extreme Fear', 'red'
+    return _MOOD_LABELS[int(np.searchsorted(_MOOD_BINS, avg_score, side='right'))]
 
 def get_paginated_stocks(page=1, per_page=5):
-    latest = get_latest_sentiment()
-    if latest is None:
+    views = _get_views()
+    if views is None:
         return [], 0, 0
-    
-    # Add top keyword
-    latest['TopKeyword'] = latest['Company'].map(TOP_KEYWORDS).fillna('N/A')
-    
-    # Sort by sentiment descending
-    latest = latest.sort_values('Overall_Sentiment', ascending=False)
-    
-    total = len(latest)
+
+    stocks = views['sorted_stocks']
+    total = len(stocks)
     total_pages = (total + per_page - 1) // per_page
-    
+
     start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    
-    page_data = latest.iloc[start_idx:end_idx]
-    
-    return page_data.to_dict('records'), total, total_pages
+    return stocks[start_idx:start_idx + per_page], total, total_pages
 
 def get_company_time_series(companies):
     df = get_all_data()
     if df is None:
         return {}
     
+    # One isin mask + groupby instead of a full boolean scan per company
+    wanted = df[df['Company'].isin(companies)].sort_values('Period')
     result = {}
-    month_map = {'Jan':1, 'Feb':2, 'Mar':3, 'Apr':4, 'May':5, 'Jun':6,
-                 'Jul':7, 'Aug':8, 'Sep':9, 'Oct':10, 'Nov':11, 'Dec':12}
-    
-    for company in companies:
-        company_data = df[df['Company'] == company].copy()
-        if company_data.empty:
-            continue
-        company_data['Month_Num'] = company_data['Month'].map(month_map)
-        company_data['Sort_Date'] = company_data['Year'].astype(str) + company_data['Month_Num'].astype(str).str.zfill(2)
-        company_data = company_data.sort_values('Sort_Date')
-        
+    for company, group in wanted.groupby('Company', sort=False, observed=True):
         result[company] = [
-            {'period': f"{row['Month']} {row['Year']}", 'score': round(row['Overall_Sentiment'], 3)}
-            for _, row in company_data.iterrows()
+            {'period': f"{month} {year}", 'score': round(score, 3)}
+            for month, year, score in zip(group['Month'], group['Year'],
+                                          group['Overall_Sentiment'])
         ]
-    
     return result
 
 def get_all_companies():
     latest = get_latest_sentiment()
     if latest is None:
         return []
-    return sorted(latest['Company'].unique().tolist())
+    # O(cardinality) off the categorical, not O(rows)
+    return sorted(latest['Company'].cat.categories.tolist())
 
 # ==============================================================================
 # FLASK APP
 # ==============================================================================
 app = Flask(__name__)
 
+def _json_response(payload):
+    """jsonify, but through orjson (C-level, NumPy-aware) when installed."""
+    if orjson is not None:
+        return app.response_class(
+            orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+            mimetype='application/json')
+    return jsonify(payload)
+
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html class="dark" lang="en"><head>
 <meta charset="utf-8"/>
@@ -872,7 +958,7 @@ def api_stocks():
     page = int(request.args.get('page', 1))
     per_page = int(request.args.get('per_page', 5))
     stocks, total, total_pages = get_paginated_stocks(page, per_page)
-    return jsonify({
+    return _json_response({
         'stocks': stocks,
         'total': total,
         'total_pages': total_pages,
@@ -883,7 +969,7 @@ def api_stocks():
 def api_data():
     stats = get_summary_stats()
     mood, mood_color = get_market_mood(stats['avg_score'])
-    return jsonify({
+    return _json_response({
         'top_positive': get_top_positive(5),
         'top_negative': get_top_negative(5),
         'sector_leaders': get_sector_leaders(),
@@ -898,53 +984,76 @@ def api_data():
 def api_timeseries():
     companies = request.args.get('companies', '').split(',')
     companies = [c.strip() for c in companies if c.strip()]
-    return jsonify(get_company_time_series(companies))
+    return _json_response(get_company_time_series(companies))
+
+# Rendered export bytes, kept per data version so repeat clicks (and
+# conditional GETs) skip the workbook rebuild
+_EXPORT_CACHE = {'mtime': None, 'xlsx': None, 'parquet': None}
 
 @app.route('/api/export')
 def api_export():
-    """Export ALL time period data to Excel (full historical data)"""
+    """Export ALL time period data to Excel or Parquet (full historical data)"""
     df = get_all_data()
     if df is None:
         return jsonify({'error': 'No data available'}), 404
-    
-    # Add top keyword
-    df['TopKeyword'] = df['Company'].map(TOP_KEYWORDS).fillna('N/A')
-    
-    # Sort by Company and Date
-    month_map = {'Jan':1, 'Feb':2, 'Mar':3, 'Apr':4, 'May':5, 'Jun':6,
-                 'Jul':7, 'Aug':8, 'Sep':9, 'Oct':10, 'Nov':11, 'Dec':12}
-    df['Month_Num'] = df['Month'].map(month_map)
-    df = df.sort_values(['Company', 'Year', 'Month_Num'], ascending=[True, False, False])
-    
-    # Select relevant columns
-    export_cols = ['Company', 'Sector', 'Year', 'Month', 'Overall_Sentiment', 
-                   'Polarity', 'Keyword_Sentiment', 'Guidance', 'Risk', 'TopKeyword']
-    export_df = df[[c for c in export_cols if c in df.columns]]
-    
-    # Create Excel file in memory
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        export_df.to_excel(writer, sheet_name='Sentiment Analysis (All Periods)', index=False)
-    output.seek(0)
-    
+
+    if _EXPORT_CACHE['mtime'] != _DATA_CACHE['mtime']:
+        _EXPORT_CACHE.update({'mtime': _DATA_CACHE['mtime'], 'xlsx': None, 'parquet': None})
+
+    fmt = 'parquet' if request.args.get('format') == 'parquet' else 'xlsx'
+    if _EXPORT_CACHE[fmt] is None:
+        # Sort by Company and Date (Month_Num and TopKeyword are
+        # pre-computed at cache time)
+        export_df = df.sort_values(['Company', 'Year', 'Month_Num'],
+                                   ascending=[True, False, False])
+
+        # Select relevant columns
+        export_cols = ['Company', 'Sector', 'Year', 'Month', 'Overall_Sentiment',
+                       'Polarity', 'Keyword_Sentiment', 'Guidance', 'Risk', 'TopKeyword']
+        export_df = export_df[[c for c in export_cols if c in export_df.columns]]
+
+        output = io.BytesIO()
+        if fmt == 'parquet':
+            try:
+                export_df.to_parquet(output, compression='zstd')
+            except ImportError:
+                return jsonify({'error': 'Parquet export requires pyarrow'}), 501
+        else:
+            with pd.ExcelWriter(output, engine='openpyxl') as writer:
+                export_df.to_excel(writer, sheet_name='Sentiment Analysis (All Periods)', index=False)
+        _EXPORT_CACHE[fmt] = output.getvalue()
+
+    mimetype = ('application/vnd.apache.parquet' if fmt == 'parquet' else
+                'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
     return send_file(
-        output,
-        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        io.BytesIO(_EXPORT_CACHE[fmt]),
+        mimetype=mimetype,
         as_attachment=True,
-        download_name='sentiment_analysis_all_periods.xlsx'
+        download_name=f'sentiment_analysis_all_periods.{fmt}',
+        conditional=True,
+        etag=f"export-{fmt}-{_EXPORT_CACHE['mtime']}",
+        last_modified=_EXPORT_CACHE['mtime'],
+        max_age=300
     )
 
 @app.route('/health')
 def health():
     return jsonify({'status': 'healthy', 'data_loaded': EXCEL_FILE.exists()})
 
+# Warm the data cache at import time: under `gunicorn --preload` the master
+# parses the file once and forked workers share the frame copy-on-write
+load_sentiment_data()
+
 if __name__ == "__main__":
     port = int(os.environ.get('PORT', 5001))
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true')
     print("\n" + "=" * 60)
     print(" INDIAN STOCK MARKET SENTIMENT TERMINAL")
     print("=" * 60)
     print(f" Dashboard: http://localhost:{port}")
     print(f" Data File: {EXCEL_FILE}")
     print(f" Data Exists: {EXCEL_FILE.exists()}")
+    print(" Dev server; in production run:")
+    print(f"   gunicorn -w 4 --preload -k gthread --threads 4 -b 0.0.0.0:{port} app:app")
     print("=" * 60 + "\n")
-    app.run(host='0.0.0.0', port=port, debug=False)
+    app.run(host='0.0.0.0', port=port, debug=debug)
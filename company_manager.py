@@ -5,8 +5,10 @@ Single source of truth for Nifty 500 company data.
 Handles dynamic sector mapping, company validation, and custom company addition.
 """
 
+import asyncio
 import json
 import logging
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 from urllib.parse import quote
@@ -52,6 +54,10 @@ class CompanyManager:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         }
         
+        # Validation result cache: {NSE_CODE: (result, timestamp)}
+        self._validation_cache = {}
+        self._validation_cache_ttl = 3600  # seconds
+
         # Load data
         self.nifty500_df = self._load_nifty500()
         self.custom_companies = self._load_custom_companies()
@@ -60,25 +66,48 @@ class CompanyManager:
         self._build_indices()
     
     def _load_nifty500(self) -> pd.DataFrame:
-        """Load Nifty 500 companies from CSV."""
+        """
+        Load Nifty 500 companies from CSV.
+        Maintains a Feather sidecar (memory-mappable columnar format) next to
+        the CSV so that repeat loads skip text parsing entirely.
+        """
         if not self.csv_path.exists():
             logger.warning(f"Nifty 500 CSV not found: {self.csv_path}")
             return pd.DataFrame(columns=['Name', 'BSE Code', 'NSE Code', 'Industry', 'Market Capitalization'])
-        
+
+        cache_path = self.csv_path.with_suffix('.feather')
+
+        # Fast path: Feather cache is newer than (or as new as) the CSV
+        if cache_path.exists():
+            try:
+                if cache_path.stat().st_mtime >= self.csv_path.stat().st_mtime:
+                    df = pd.read_feather(cache_path)
+                    logger.info(f"Loaded {len(df)} companies from Feather cache")
+                    return df
+            except Exception as e:
+                logger.warning(f"Error reading Feather cache (falling back to CSV): {e}")
+
         try:
             df = pd.read_csv(self.csv_path)
             # Clean column names
             df.columns = df.columns.str.strip()
-            
+
             # Fill missing values
             df['NSE Code'] = df['NSE Code'].fillna('')
             df['BSE Code'] = df['BSE Code'].fillna('')
             df['Industry'] = df['Industry'].fillna('Unknown')
             df['Market Capitalization'] = df['Market Capitalization'].fillna(0)
-            
+
+            # Write the sidecar so subsequent loads are zero-parse
+            try:
+                df.to_feather(cache_path)
+            except Exception as e:
+                # pyarrow not installed or read-only filesystem - CSV path still works
+                logger.debug(f"Could not write Feather cache: {e}")
+
             logger.info(f"Loaded {len(df)} companies from Nifty 500 CSV")
             return df
-            
+
         except Exception as e:
             logger.error(f"Error loading Nifty 500 CSV: {e}")
             return pd.DataFrame(columns=['Name', 'BSE Code', 'NSE Code', 'Industry', 'Market Capitalization'])
@@ -103,94 +132,132 @@ class CompanyManager:
         except Exception as e:
             logger.error(f"Error saving custom companies: {e}")
     
+    COMPANY_COLUMNS = ['name', 'nse_code', 'bse_code', 'industry', 'market_cap', 'source']
+
     def _build_indices(self):
-        """Build lookup indices for fast access."""
-        self.nse_to_info = {}
-        self.bse_to_info = {}
-        self.name_to_info = {}
-        
-        # Index Nifty 500 companies
-        for _, row in self.nifty500_df.iterrows():
-            info = {
-                'name': str(row['Name']).strip(),
-                'nse_code': str(row['NSE Code']).strip(),
-                'bse_code': str(row['BSE Code']).strip(),
-                'industry': str(row['Industry']).strip(),
-                'market_cap': float(row['Market Capitalization']) if pd.notna(row['Market Capitalization']) else 0,
+        """
+        Build the canonical companies DataFrame and key->row indices.
+        One DataFrame replaces three parallel dict-of-dicts; lookups by NSE
+        code, BSE code or name all resolve to a row of the same frame.
+        """
+        records = []
+
+        # Nifty 500 companies (itertuples is much cheaper than iterrows)
+        nifty_cols = ['Name', 'NSE Code', 'BSE Code', 'Industry', 'Market Capitalization']
+        for name, nse, bse, industry, market_cap in self.nifty500_df[nifty_cols].itertuples(index=False, name=None):
+            records.append({
+                'name': str(name).strip(),
+                'nse_code': str(nse).strip(),
+                'bse_code': str(bse).strip(),
+                'industry': str(industry).strip(),
+                'market_cap': float(market_cap) if pd.notna(market_cap) else 0,
                 'source': 'nifty500'
-            }
-            
-            if info['nse_code'] and info['nse_code'].lower() != 'nan':
-                self.nse_to_info[info['nse_code'].upper()] = info
-            if info['bse_code'] and info['bse_code'].lower() != 'nan':
-                self.bse_to_info[info['bse_code']] = info
-            if info['name']:
-                self.name_to_info[info['name'].upper()] = info
-        
-        # Index custom companies
+            })
+
+        # Custom companies
         for company in self.custom_companies:
-            info = {
+            records.append({
                 'name': company.get('name', ''),
                 'nse_code': company.get('nse_code', ''),
                 'bse_code': company.get('bse_code', ''),
                 'industry': company.get('industry', 'Unknown'),
                 'market_cap': company.get('market_cap', 0),
                 'source': 'custom'
-            }
-            
-            if info['nse_code']:
-                self.nse_to_info[info['nse_code'].upper()] = info
-            if info['bse_code']:
-                self.bse_to_info[info['bse_code']] = info
-            if info['name']:
-                self.name_to_info[info['name'].upper()] = info
+            })
+
+        self.companies_df = pd.DataFrame(records, columns=self.COMPANY_COLUMNS)
+        self._all_companies_cache = None
+        self._rebuild_key_indices()
+
+    def _rebuild_key_indices(self):
+        """Rebuild the key->row-position Series from companies_df."""
+        df = self.companies_df
+
+        nse_upper = df['nse_code'].astype(str).str.upper()
+        valid_nse = (nse_upper != '') & (nse_upper != 'NAN')
+        self._nse_idx = self._dedup_index(pd.Series(df.index[valid_nse].values, index=nse_upper[valid_nse]))
+
+        bse = df['bse_code'].astype(str)
+        valid_bse = (bse != '') & (bse.str.upper() != 'NAN')
+        self._bse_idx = self._dedup_index(pd.Series(df.index[valid_bse].values, index=bse[valid_bse]))
+
+        name_upper = df['name'].astype(str).str.upper()
+        valid_name = name_upper != ''
+        self._name_idx = self._dedup_index(pd.Series(df.index[valid_name].values, index=name_upper[valid_name]))
+
+    @staticmethod
+    def _dedup_index(series: pd.Series) -> pd.Series:
+        """Keep the last entry per key (same semantics as dict overwrite)."""
+        return series[~series.index.duplicated(keep='last')]
+
+    def _lookup(self, index: pd.Series, key: str) -> Optional[Dict]:
+        """Resolve a key via an index Series to a company info dict."""
+        label = index.get(key)
+        if label is None:
+            return None
+        return self.companies_df.loc[int(label)].to_dict()
+
+    def _index_one(self, info: Dict):
+        """
+        Incrementally add one company to companies_df and the key indices.
+        O(1) per insert instead of rebuilding everything via _build_indices.
+        """
+        label = int(self.companies_df.index.max()) + 1 if len(self.companies_df) else 0
+        self.companies_df.loc[label] = [info.get(col, '') for col in self.COMPANY_COLUMNS]
+
+        nse_upper = str(info.get('nse_code', '')).upper()
+        if nse_upper and nse_upper != 'NAN':
+            self._nse_idx[nse_upper] = label
+        bse = str(info.get('bse_code', ''))
+        if bse and bse.upper() != 'NAN':
+            self._bse_idx[bse] = label
+        name_upper = str(info.get('name', '')).upper()
+        if name_upper:
+            self._name_idx[name_upper] = label
+
+        self._all_companies_cache = None
+
+    def _unindex_custom(self, nse_upper: str):
+        """Drop a custom company's rows and refresh the key indices."""
+        df = self.companies_df
+        mask = (df['source'] == 'custom') & (df['nse_code'].astype(str).str.upper() == nse_upper)
+        if mask.any():
+            self.companies_df = df[~mask]
+            # Vectorized index refresh; also restores any Nifty 500 keys the
+            # removed custom entry was shadowing.
+            self._rebuild_key_indices()
+        self._all_companies_cache = None
     
     def get_all_companies(self) -> List[Dict]:
         """
         Get all companies (Nifty 500 + custom).
-        
+        Served from companies_df (built once in _build_indices) instead of
+        re-walking the Nifty 500 DataFrame on every call.
+
         Returns:
             List of company info dicts
         """
-        companies = []
-        
-        # Add Nifty 500 companies
-        for _, row in self.nifty500_df.iterrows():
-            nse_code = str(row['NSE Code']).strip()
-            if nse_code and nse_code.lower() != 'nan':
-                companies.append({
-                    'name': str(row['Name']).strip(),
-                    'nse_code': nse_code,
-                    'bse_code': str(row['BSE Code']).strip() if pd.notna(row['BSE Code']) else '',
-                    'industry': str(row['Industry']).strip(),
-                    'market_cap': float(row['Market Capitalization']) if pd.notna(row['Market Capitalization']) else 0,
-                    'source': 'nifty500'
-                })
-        
-        # Add custom companies
-        for company in self.custom_companies:
-            companies.append({
-                'name': company.get('name', ''),
-                'nse_code': company.get('nse_code', ''),
-                'bse_code': company.get('bse_code', ''),
-                'industry': company.get('industry', 'Unknown'),
-                'market_cap': company.get('market_cap', 0),
-                'source': 'custom'
-            })
-        
-        return companies
+        if self._all_companies_cache is None:
+            df = self.companies_df
+            nse_upper = df['nse_code'].astype(str).str.upper()
+            # Nifty rows without a tradeable NSE code are excluded (as before);
+            # custom companies are always included.
+            keep = (df['source'] == 'custom') | ((nse_upper != '') & (nse_upper != 'NAN'))
+            self._all_companies_cache = df[keep].to_dict('records')
+
+        return list(self._all_companies_cache)
     
     def get_company_by_nse(self, nse_code: str) -> Optional[Dict]:
         """Get company info by NSE code."""
-        return self.nse_to_info.get(nse_code.upper())
-    
+        return self._lookup(self._nse_idx, nse_code.upper())
+
     def get_company_by_bse(self, bse_code: str) -> Optional[Dict]:
         """Get company info by BSE code."""
-        return self.bse_to_info.get(str(bse_code))
-    
+        return self._lookup(self._bse_idx, str(bse_code))
+
     def get_company_by_name(self, name: str) -> Optional[Dict]:
         """Get company info by name."""
-        return self.name_to_info.get(name.upper())
+        return self._lookup(self._name_idx, name.upper())
     
     def get_company(self, identifier: str) -> Optional[Dict]:
         """
@@ -240,24 +307,92 @@ class CompanyManager:
         Returns:
             True if company page exists
         """
+        code_upper = nse_code.upper()
+        cached = self._get_cached_validation(code_upper)
+        if cached is not None:
+            return cached
+
         url = f"{self.base_url}/company/{quote(nse_code)}/consolidated/"
-        
+
         try:
             if USE_CFFI:
                 response = cffi_requests.get(
-                    url, 
-                    headers=self.headers, 
+                    url,
+                    headers=self.headers,
                     impersonate=self.impersonate_ver,
                     timeout=10
                 )
             else:
                 response = cffi_requests.get(url, headers=self.headers, timeout=10)
-            
-            return response.status_code == 200
-            
+
+            result = response.status_code == 200
+
         except Exception as e:
             logger.warning(f"Validation failed for {nse_code}: {e}")
-            return False
+            result = False
+
+        self._validation_cache[code_upper] = (result, time.time())
+        return result
+
+    def _get_cached_validation(self, code_upper: str) -> Optional[bool]:
+        """Return a cached validation result if still within TTL."""
+        entry = self._validation_cache.get(code_upper)
+        if entry and time.time() - entry[1] < self._validation_cache_ttl:
+            return entry[0]
+        return None
+
+    def validate_on_screener_bulk(self, nse_codes: List[str], concurrency: int = 20) -> Dict[str, bool]:
+        """
+        Validate many companies on screener.in concurrently.
+        Network round-trips overlap, so N validations complete in roughly
+        the time of the slowest one instead of their sum.
+
+        Args:
+            nse_codes: NSE codes to validate
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            Dict mapping each NSE code to True if its company page exists
+        """
+        if not nse_codes:
+            return {}
+
+        if not USE_CFFI:
+            # No async client available - fall back to the (cached) serial path
+            return {code: self.validate_on_screener(code) for code in nse_codes}
+
+        return asyncio.run(self._validate_bulk_async(nse_codes, concurrency))
+
+    async def _validate_bulk_async(self, nse_codes: List[str], concurrency: int) -> Dict[str, bool]:
+        """Async worker for validate_on_screener_bulk (curl_cffi AsyncSession)."""
+        from curl_cffi.requests import AsyncSession
+
+        results = {}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with AsyncSession(impersonate=self.impersonate_ver) as session:
+            async def check(code: str):
+                code_upper = code.upper()
+                cached = self._get_cached_validation(code_upper)
+                if cached is not None:
+                    results[code] = cached
+                    return
+
+                url = f"{self.base_url}/company/{quote(code)}/consolidated/"
+                async with semaphore:
+                    try:
+                        response = await session.get(url, headers=self.headers, timeout=10)
+                        result = response.status_code == 200
+                    except Exception as e:
+                        logger.warning(f"Validation failed for {code}: {e}")
+                        result = False
+
+                self._validation_cache[code_upper] = (result, time.time())
+                results[code] = result
+
+            await asyncio.gather(*(check(code) for code in nse_codes))
+
+        return results
     
     def add_custom_company(
         self,
@@ -290,7 +425,7 @@ class CompanyManager:
             return {'success': False, 'message': 'At least one of NSE code or BSE code is required'}
         
         # Check if already exists
-        if nse_code and nse_code.upper() in self.nse_to_info:
+        if nse_code and nse_code.upper() in self._nse_idx.index:
             return {'success': False, 'message': f'Company with NSE code {nse_code} already exists'}
         
         # Validate on screener.in if requested
@@ -309,7 +444,7 @@ class CompanyManager:
         
         self.custom_companies.append(company)
         self._save_custom_companies()
-        self._build_indices()  # Rebuild indices
+        self._index_one({**company, 'source': 'custom'})  # Incremental index update
         
         logger.info(f"Added custom company: {name} ({nse_code})")
         
@@ -332,7 +467,7 @@ class CompanyManager:
         
         if len(self.custom_companies) < original_len:
             self._save_custom_companies()
-            self._build_indices()
+            self._unindex_custom(nse_upper)
             return {'success': True, 'message': f'Company {nse_code} removed'}
         
         return {'success': False, 'message': f'Custom company {nse_code} not found'}
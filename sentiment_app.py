@@ -15,28 +15,93 @@ API Endpoints:
 import os
 import sys
 import time
+import asyncio
+import bisect
+import functools
 import re
+import json
+import hashlib
 import logging
 import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.parse import urljoin, quote, urlparse
-from flask import Flask, render_template_string, jsonify, request, Response
+from flask import Flask, jsonify, request, Response, stream_with_context, send_file
+import jinja2
+from markupsafe import escape
 import pandas as pd
 import numpy as np
-from bs4 import BeautifulSoup
-from curl_cffi import requests as cffi_requests
 import warnings
 
-# Optional NLP imports
+# orjson serializes small dicts 2-5x faster than stdlib json (and handles
+# numpy scalars natively); fall back to json/jsonify when it isn't installed
 try:
-    import PyPDF2
-    from textblob import TextBlob
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    def _json_response(obj):
+        return Response(orjson.dumps(obj), mimetype='application/json')
 except ImportError:
-    print("[!] Installing required packages...")
-    import subprocess
-    subprocess.run([sys.executable, "-m", "pip", "install", "PyPDF2", "textblob", "openpyxl", "-q"], check=True)
-    import PyPDF2
-    from textblob import TextBlob
+    _dumps = json.dumps  # module-level bind skips the attribute lookup per SSE event
+
+    def _json_response(obj):
+        return jsonify(obj)
+
+# ==================== LAZY HEAVY IMPORTS ====================
+# The dashboard endpoints never touch PyPDF2/TextBlob or the scraping stack,
+# so those imports are deferred until an analysis run actually starts. This
+# keeps Flask cold start fast and idle RSS small.
+PyPDF2 = None
+_BLOBBER = None
+BeautifulSoup = None
+cffi_requests = None
+BS_PARSER = 'html.parser'
+
+def _ensure_nlp():
+    """Import PDF/NLP deps on first use (installing them if missing)."""
+    global PyPDF2, _BLOBBER
+    if _BLOBBER is not None:
+        return
+    try:
+        import PyPDF2 as _pypdf2
+        from textblob import Blobber
+        from textblob.sentiments import PatternAnalyzer
+    except ImportError:
+        print("[!] Installing required packages...")
+        import subprocess
+        subprocess.run([sys.executable, "-m", "pip", "install", "PyPDF2", "textblob", "openpyxl", "-q"], check=True)
+        import PyPDF2 as _pypdf2
+        from textblob import Blobber
+        from textblob.sentiments import PatternAnalyzer
+    PyPDF2 = _pypdf2
+    # Shared Blobber so the Pattern analyzer is instantiated once per process
+    # instead of once per document scored
+    _BLOBBER = Blobber(analyzer=PatternAnalyzer())
+
+def _ensure_scraper():
+    """Import BeautifulSoup / curl_cffi on first downloader instantiation."""
+    global BeautifulSoup, cffi_requests, BS_PARSER
+    if cffi_requests is not None:
+        return
+    from bs4 import BeautifulSoup as _bs
+    from curl_cffi import requests as _cffi
+    BeautifulSoup = _bs
+    cffi_requests = _cffi
+    try:
+        import lxml  # noqa: F401
+        BS_PARSER = 'lxml'
+    except ImportError:
+        BS_PARSER = 'html.parser'
+
+# Fast C-backed PDF extraction (optional, falls back to PyPDF2)
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
 
 warnings.filterwarnings('ignore')
 np.random.seed(42)
@@ -54,6 +119,9 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Analysis state
+# NOTE: per-process only. Under gunicorn with multiple workers this dict is
+# not shared; move it to redis or a multiprocessing.Manager().dict() if
+# cross-worker progress reporting is ever needed.
 analysis_status = {'running': False, 'progress': 0, 'total': 0, 'current': '', 'logs': []}
 
 # ==================== SECTOR MAPPING ====================
@@ -75,11 +143,61 @@ SECTOR_MAPPING = {
     'TITAN': 'Consumer', 'TRENT': 'Retail', 'ULTRACEMCO': 'Cement', 'WIPRO': 'IT',
 }
 
+# Keys above are already uppercase; build the lookup table once and memoize
+# per-company answers so hot paths skip repeated .upper() + dict probing
+_SECTOR_UPPER = {k.upper(): v for k, v in SECTOR_MAPPING.items()}
+
+@functools.lru_cache(maxsize=64)
+def _sector_of(name):
+    return _SECTOR_UPPER.get(name.upper(), 'Unknown')
+
+# ==================== PRECOMPILED PATTERNS ====================
+# Compiled once at import so hot paths call Pattern.search/sub directly
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r"[^\w\s\.\,\!\?\;\:\-\']")
+_DATE_FN_RE = re.compile(r'([A-Z0-9&\-]+)_([A-Za-z]{3})_(\d{4})_Transcript')
+_MONTH_RE = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})$')
+_URL_DATE_RE = re.compile(r'(\d{4})[/-](\d{2})[/-](\d{2})')
+_GUIDE_UP_RE = re.compile(r'rais.*guidance|exceed.*expectation')
+_GUIDE_DN_RE = re.compile(r'lower.*guidance|miss.*expectation')
+# Deletes every ASCII char that isn't alphanumeric, space, underscore or
+# hyphen; str.translate beats re.sub for a plain character-class strip
+_QTBL = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128)) if not (ch.isalnum() or ch in ' _-')))
+
+# ==================== KEYWORD MATCHING ====================
+POSITIVE_KEYWORDS = ['strong', 'growth', 'improve', 'excellent', 'success', 'expand', 'opportunity', 'robust', 'resilient', 'positive', 'outperform', 'beat', 'exceed', 'momentum', 'strength']
+NEGATIVE_KEYWORDS = ['weak', 'decline', 'challenge', 'pressure', 'concern', 'risk', 'uncertain', 'difficult', 'headwind', 'negative', 'underperform', 'miss', 'delay', 'slow', 'struggle']
+
+# One linear scan (Aho-Corasick if available, else a single compiled regex)
+# replaces 30 full str.count passes per document. Words are space-padded to
+# keep the original ' kw ' boundary semantics.
+try:
+    import ahocorasick
+    _KW_AUTOMATON = ahocorasick.Automaton()
+    for _kw in POSITIVE_KEYWORDS:
+        _KW_AUTOMATON.add_word(f' {_kw} ', 1)
+    for _kw in NEGATIVE_KEYWORDS:
+        _KW_AUTOMATON.add_word(f' {_kw} ', -1)
+    _KW_AUTOMATON.make_automaton()
+except ImportError:
+    _KW_AUTOMATON = None
+    _KW_POSITIVE = frozenset(POSITIVE_KEYWORDS)
+    # Single alternation compiled once; prefer google-re2's DFA engine (no
+    # backtracking, faster linear scan) when it is installed
+    _KW_PATTERN = r'\b(' + '|'.join(map(re.escape, POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS)) + r')\b'
+    try:
+        import re2
+        _KW_RE = re2.compile(_KW_PATTERN)
+    except ImportError:
+        _KW_RE = re.compile(_KW_PATTERN)
+
 # ==============================================================================
 # BACKEND: SCREENER DOWNLOADER
 # ==============================================================================
 class ScreenerDownloader:
     def __init__(self, output_folder):
+        _ensure_scraper()
         self.output_folder = Path(output_folder)
         self.base_url = "https://www.screener.in"
         self.impersonate_ver = "chrome120"
@@ -87,29 +205,25 @@ class ScreenerDownloader:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         }
+        # One session per downloader so TLS handshakes and cookies are reused
+        self.session = cffi_requests.Session(impersonate=self.impersonate_ver, headers=self.headers)
+
+    def close(self):
+        try:
+            self.session.close()
+        except:
+            pass
 
     def get_company_page(self, symbol):
         url = f"{self.base_url}/company/{quote(symbol)}/consolidated/"
         try:
-            response = cffi_requests.get(url, impersonate=self.impersonate_ver, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
             return response.text if response.status_code == 200 else None
         except:
             return None
 
-    def find_quarter_context(self, link_element):
-        previous = link_element.find_previous()
-        attempts = 0
-        while previous and attempts < 10:
-            text = previous.get_text(strip=True) if hasattr(previous, 'get_text') else str(previous)
-            match = re.match(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})$', text)
-            if match:
-                return {'quarter': f"{match.group(1)} {match.group(2)}", 'year': match.group(2)}
-            previous = previous.find_previous()
-            attempts += 1
-        return None
-
     def extract_date_from_url(self, url):
-        match = re.search(r'(\d{4})[/-](\d{2})[/-](\d{2})', url)
+        match = _URL_DATE_RE.search(url)
         if match:
             year = match.group(1)
             month_num = int(match.group(2))
@@ -119,45 +233,52 @@ class ScreenerDownloader:
         return None
 
     def extract_concall_documents(self, html_content, symbol):
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, BS_PARSER)
         documents = []
         try:
-            concalls_heading = None
-            for heading in soup.find_all(['h2', 'h3', 'h4']):
-                if heading.get_text(strip=True).lower() == 'concalls':
-                    concalls_heading = heading
-                    break
+            concalls_heading = soup.find(
+                lambda t: t.name in ('h2', 'h3', 'h4') and t.get_text(strip=True).lower() == 'concalls')
             if not concalls_heading:
                 return []
-            
-            all_links = []
-            current_element = concalls_heading.find_next()
+
             stop_keywords = ['announcements', 'annual reports', 'shareholding', 'quarters', 'documents']
-            
-            while current_element and len(all_links) < 300:
-                if current_element.name in ['h2', 'h3', 'h4']:
-                    if any(k in current_element.get_text(strip=True).lower() for k in stop_keywords):
+
+            # Single forward pass: record month-year nodes and links in document
+            # order, then match each link to its nearest preceding date with
+            # bisect instead of walking find_previous for every link.
+            date_positions = []
+            date_infos = []
+            links = []
+            position = 0
+            element = concalls_heading.find_next()
+            while element and len(links) < 300:
+                if element.name in ('h2', 'h3', 'h4'):
+                    if any(k in element.get_text(strip=True).lower() for k in stop_keywords):
                         break
-                if current_element.name == 'a':
-                    all_links.append(current_element)
-                else:
-                    all_links.extend(current_element.find_all('a', href=True) if hasattr(current_element, 'find_all') else [])
-                current_element = current_element.find_next()
-            
+                match = _MONTH_RE.match(element.get_text(strip=True))
+                if match:
+                    date_positions.append(position)
+                    date_infos.append({'quarter': f"{match.group(1)} {match.group(2)}", 'year': match.group(2)})
+                if element.name == 'a':
+                    links.append((position, element))
+                element = element.find_next()
+                position += 1
+
             seen_urls = set()
-            for link in all_links:
+            for pos, link in links:
                 href = link.get('href', '')
                 text = link.get_text(strip=True).lower()
                 if not href or href.startswith('#') or 'javascript:' in href:
                     continue
                 if 'transcript' not in text:
                     continue
-                
-                quarter_info = self.find_quarter_context(link) or self.extract_date_from_url(href)
+
+                idx = bisect.bisect_left(date_positions, pos)
+                quarter_info = date_infos[idx - 1] if idx else self.extract_date_from_url(href)
                 current_quarter = quarter_info['quarter'] if quarter_info else 'Unknown'
                 current_year = quarter_info['year'] if quarter_info else 'Unknown'
                 full_url = urljoin(self.base_url, href)
-                
+
                 if full_url not in seen_urls:
                     seen_urls.add(full_url)
                     documents.append({'symbol': symbol, 'quarter': current_quarter, 'year': current_year, 'url': full_url})
@@ -167,30 +288,59 @@ class ScreenerDownloader:
 
     def download_file(self, url, save_path):
         try:
-            response = cffi_requests.get(url, headers=self.headers, impersonate=self.impersonate_ver, timeout=60, allow_redirects=True)
-            if response.status_code == 200:
-                save_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(save_path, 'wb') as f:
-                    f.write(response.content)
-                if save_path.stat().st_size < 100:
-                    save_path.unlink()
-                    return False
-                return True
+            with self.session.get(url, stream=True, timeout=60, allow_redirects=True) as response:
+                if response.status_code == 200:
+                    save_path.parent.mkdir(parents=True, exist_ok=True)
+                    written = 0
+                    with open(save_path, 'wb', buffering=1 << 20) as f:
+                        for chunk in response.iter_content(65536):
+                            f.write(chunk)
+                            written += len(chunk)
+                    if written < 100:
+                        save_path.unlink()
+                        return False
+                    return True
         except:
             pass
         return False
 
+    async def _download_file_async(self, session, semaphore, url, save_path):
+        async with semaphore:
+            try:
+                response = await session.get(url, stream=True, timeout=60, allow_redirects=True)
+                if response.status_code == 200:
+                    save_path.parent.mkdir(parents=True, exist_ok=True)
+                    written = 0
+                    with open(save_path, 'wb', buffering=1 << 20) as f:
+                        async for chunk in response.aiter_content():
+                            f.write(chunk)
+                            written += len(chunk)
+                    if written < 100:
+                        save_path.unlink()
+                        return False
+                    return True
+            except:
+                pass
+            return False
+
+    async def _download_all(self, jobs):
+        semaphore = asyncio.Semaphore(4)
+        async with cffi_requests.AsyncSession(impersonate=self.impersonate_ver, headers=self.headers) as session:
+            results = await asyncio.gather(*[
+                self._download_file_async(session, semaphore, url, path) for url, path in jobs])
+        return sum(1 for ok in results if ok)
+
     def process_company(self, symbol, start_year=2015, end_year=2025):
         result = {'symbol': symbol, 'status': 'failed', 'downloaded': 0, 'skipped': 0}
         html = self.get_company_page(symbol)
         if not html:
             return result
-        
+
         documents = self.extract_concall_documents(html, symbol)
         if not documents:
             result['status'] = 'no_documents'
             return result
-        
+
         filtered_docs = []
         for doc in documents:
             if doc['year'] and doc['year'] != 'Unknown':
@@ -200,19 +350,22 @@ class ScreenerDownloader:
                         filtered_docs.append(doc)
                 except:
                     pass
-        
+
+        jobs = []
         for doc in filtered_docs:
             doc_folder = self.output_folder / symbol / doc['year'] / 'Transcript'
             doc_folder.mkdir(parents=True, exist_ok=True)
-            quarter_clean = re.sub(r'[^\w\s-]', '', doc['quarter']).replace(' ', '_')
+            quarter_clean = doc['quarter'].translate(_QTBL).replace(' ', '_')
             file_path = doc_folder / f"{symbol}_{quarter_clean}_Transcript.pdf"
-            
+
             if file_path.exists():
                 result['skipped'] += 1
-            elif self.download_file(doc['url'], file_path):
-                result['downloaded'] += 1
-            time.sleep(0.5)
-        
+            else:
+                jobs.append((doc['url'], file_path))
+
+        if jobs:
+            result['downloaded'] = asyncio.run(self._download_all(jobs))
+
         result['status'] = 'success'
         return result
 
@@ -221,30 +374,80 @@ class ScreenerDownloader:
 # ==============================================================================
 class SentimentAnalyzer:
     def __init__(self, pdf_folder, output_file):
+        _ensure_nlp()
         self.pdf_folder = Path(pdf_folder)
         self.output_file = Path(output_file)
+        self.parquet_file = self.output_file.with_suffix('.parquet')
+        self.existing_df = pd.DataFrame()
+        self.processed_keys = set()
+        # Content-hash cache: sha256(pdf bytes) -> scored metrics, so
+        # unchanged transcripts skip PDF parsing and scoring on re-runs
+        self.cache_path = self.output_file.parent / ".sentiment_cache.json"
+        self.pdf_cache = self._load_pdf_cache()
+        self._load_existing_data()
+
+    def reset(self):
+        """Re-sync in-memory state with the on-disk store between runs."""
         self.existing_df = pd.DataFrame()
         self.processed_keys = set()
+        self.pdf_cache = self._load_pdf_cache()
         self._load_existing_data()
 
+    def _load_pdf_cache(self):
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                return json.load(f)
+        except:
+            return {}
+
+    def _save_pdf_cache(self):
+        try:
+            tmp_path = self.cache_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self.pdf_cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except:
+            pass
+
     def _load_existing_data(self):
-        if self.output_file.exists():
-            try:
+        try:
+            if self.parquet_file.exists():
+                df = pd.read_parquet(self.parquet_file)
+            elif self.output_file.exists():
                 df = pd.read_excel(self.output_file, sheet_name='Quarterly Sentiment')
-                self.existing_df = df
-                for _, row in df.iterrows():
-                    self.processed_keys.add((str(row['Company']), str(row['Year']), str(row['Month'])))
-            except:
-                pass
+            else:
+                return
+            self.existing_df = df
+            self.processed_keys = frozenset(zip(
+                df['Company'].astype(str), df['Year'].astype(str), df['Month'].astype(str)))
+        except:
+            pass
 
-    def extract_date_details(self, filename):
-        pattern = r'([A-Z0-9&\-]+)_([A-Za-z]{3})_(\d{4})_Transcript'
-        match = re.search(pattern, filename)
+    @staticmethod
+    def _hash_file(path):
+        with open(path, 'rb') as fh:
+            return hashlib.sha256(fh.read()).hexdigest()
+
+    @staticmethod
+    def extract_date_details(filename):
+        match = _DATE_FN_RE.search(filename)
         if match:
             return match.group(2), match.group(3)
         return None, None
 
-    def extract_text_from_pdf(self, pdf_path):
+    @staticmethod
+    def extract_text_from_pdf(pdf_path):
+        # PyMuPDF extracts text an order of magnitude faster than PyPDF2
+        if PYMUPDF_AVAILABLE:
+            try:
+                doc = fitz.open(pdf_path)
+                text = "".join(doc[i].get_text("text") for i in range(min(15, doc.page_count)))
+                doc.close()
+                return text
+            except:
+                return ""
         try:
             text = ""
             with open(pdf_path, 'rb') as file:
@@ -255,29 +458,47 @@ class SentimentAnalyzer:
         except:
             return ""
 
-    def clean_text(self, text):
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\']', '', text)
+    @staticmethod
+    def clean_text(text):
+        text = _WS_RE.sub(' ', text)
+        text = _PUNCT_RE.sub('', text)
         return text.strip()
 
-    def get_polarity(self, text):
-        if not text or len(text.split()) < 20:
+    @staticmethod
+    def get_polarity(text, n_words=None):
+        if n_words is None:
+            n_words = len(text.split())
+        if not text or n_words < 20:
             return 0.0
-        return round(TextBlob(text).sentiment.polarity, 3)
-
-    def get_keyword_sentiment(self, text):
-        positive = ['strong', 'growth', 'improve', 'excellent', 'success', 'expand', 'opportunity', 'robust', 'resilient', 'positive', 'outperform', 'beat', 'exceed', 'momentum', 'strength']
-        negative = ['weak', 'decline', 'challenge', 'pressure', 'concern', 'risk', 'uncertain', 'difficult', 'headwind', 'negative', 'underperform', 'miss', 'delay', 'slow', 'struggle']
-        text_lower = text.lower()
-        pos_count = sum(text_lower.count(' ' + kw + ' ') for kw in positive)
-        neg_count = sum(text_lower.count(' ' + kw + ' ') for kw in negative)
+        return round(_BLOBBER(text).sentiment.polarity, 3)
+
+    @staticmethod
+    def get_keyword_sentiment(text, text_lower=None):
+        if text_lower is None:
+            text_lower = text.lower()
+        text_lower = ' ' + text_lower + ' '
+        pos_count = 0
+        neg_count = 0
+        if _KW_AUTOMATON is not None:
+            for _, sign in _KW_AUTOMATON.iter(text_lower):
+                if sign > 0:
+                    pos_count += 1
+                else:
+                    neg_count += 1
+        else:
+            counts = Counter(_KW_RE.findall(text_lower))
+            pos_count = sum(c for w, c in counts.items() if w in _KW_POSITIVE)
+            neg_count = sum(counts.values()) - pos_count
         total = pos_count + neg_count
         if total == 0:
             return 0.0
         return round(max(-1.0, min(1.0, (pos_count - neg_count) / total)), 3)
 
-    def get_composite_score(self, polarity, keyword, text):
-        guidance = 1.0 if re.search(r'rais.*guidance|exceed.*expectation', text.lower()) else (-1.0 if re.search(r'lower.*guidance|miss.*expectation', text.lower()) else 0.0)
+    @staticmethod
+    def get_composite_score(polarity, keyword, text, text_lower=None):
+        if text_lower is None:
+            text_lower = text.lower()
+        guidance = 1.0 if _GUIDE_UP_RE.search(text_lower) else (-1.0 if _GUIDE_DN_RE.search(text_lower) else 0.0)
         composite = (polarity * 0.40) + (keyword * 0.40) + (guidance * 0.20)
         return round(composite, 3), guidance
 
@@ -285,40 +506,103 @@ class SentimentAnalyzer:
         company_folder = self.pdf_folder / company_name
         if not company_folder.exists():
             return []
-        
-        sector = SECTOR_MAPPING.get(company_name.upper(), 'Unknown')
+
+        sector = _sector_of(company_name)
+
+        # Collect unprocessed PDFs first (processed_keys filtering stays in the
+        # parent); unchanged files are served straight from the hash cache
+        jobs = []
         results = []
-        
-        for year_folder in sorted([d for d in company_folder.iterdir() if d.is_dir()]):
-            type_folder = year_folder / 'Transcript'
-            if not type_folder.exists():
+        # os.scandir reuses the type/stat info from readdir, so enumerating
+        # years and PDFs costs no extra stat syscalls per entry
+        candidates = []
+        with os.scandir(company_folder) as it:
+            year_dirs = sorted(e.path for e in it if e.is_dir())
+        for year_dir in year_dirs:
+            type_folder = os.path.join(year_dir, 'Transcript')
+            try:
+                with os.scandir(type_folder) as it:
+                    pdfs = sorted(e.path for e in it if e.is_file() and e.name.endswith('.pdf'))
+            except OSError:
                 continue
-            
-            for f in sorted(type_folder.glob("*.pdf")):
-                month, year = self.extract_date_details(f.name)
+
+            for f in pdfs:
+                month, year = self.extract_date_details(os.path.basename(f))
                 if not month or not year:
                     continue
-                if (str(company_name), str(year), str(month)) in self.processed_keys:
+                # company_name and the regex-extracted month/year are already
+                # strings; no per-file str() wraps needed
+                if (company_name, year, month) in self.processed_keys:
                     continue
-                
-                raw_text = self.extract_text_from_pdf(f)
-                if not raw_text or len(raw_text.split()) < 100:
-                    continue
-                
-                text = self.clean_text(raw_text)
-                polarity = self.get_polarity(text)
-                keyword = self.get_keyword_sentiment(text)
-                composite, guidance = self.get_composite_score(polarity, keyword, text)
-                risk = round(text.lower().count('risk') / (len(text.split())/1000), 3) if len(text) > 0 else 0
-                
+                candidates.append((f, month, year))
+
+        if not candidates:
+            return results
+
+        # Hash all candidate PDFs with a few overlapping reads so one slow
+        # disk access doesn't serialize the rest of the batch
+        hashes = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as pool:
+            futs = {pool.submit(self._hash_file, f): f for f, _, _ in candidates}
+            for fut in as_completed(futs):
+                try:
+                    hashes[futs[fut]] = fut.result()
+                except:
+                    pass
+
+        for f, month, year in candidates:
+            file_hash = hashes.get(f)
+            if file_hash is None:
+                continue
+
+            cached = self.pdf_cache.get(file_hash)
+            if cached is not None:
                 results.append({
                     'Company': company_name, 'Sector': sector, 'Year': year, 'Month': month,
-                    'Overall_Sentiment': composite, 'Polarity': polarity, 'Keyword_Sentiment': keyword,
-                    'Guidance': guidance, 'Risk': risk, 'File_Count': 1
+                    **cached, 'File_Count': 1
                 })
+                continue
+
+            jobs.append((f, month, year, file_hash))
+
+        if not jobs:
+            return results
+
+        # PDF extraction is CPU-bound; spread PDFs across worker processes
+        max_workers = min(os.cpu_count() or 1, 4, len(jobs))
+
+        if max_workers <= 1:
+            for f, month, year, file_hash in jobs:
+                result = _analyze_pdf(f, company_name, sector, month, year)
+                if result:
+                    self._cache_result(file_hash, result)
+                    results.append(result)
+            return results
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_analyze_pdf, f, company_name, sector, month, year): file_hash
+                       for f, month, year, file_hash in jobs}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    if result:
+                        self._cache_result(futures[future], result)
+                        results.append(result)
+                except:
+                    pass
         return results
 
-    def combine_and_save(self, all_results):
+    def _cache_result(self, file_hash, result):
+        """Store the scored metrics (not company/date identity) by content hash."""
+        self.pdf_cache[file_hash] = {
+            'Overall_Sentiment': result['Overall_Sentiment'],
+            'Polarity': result['Polarity'],
+            'Keyword_Sentiment': result['Keyword_Sentiment'],
+            'Guidance': result['Guidance'],
+            'Risk': result['Risk'],
+        }
+
+    def combine_and_save(self, all_results, export_xlsx=False):
         if not all_results:
             return
         
@@ -328,11 +612,11 @@ class SentimentAnalyzer:
             'Guidance': 'mean', 'Risk': 'mean', 'File_Count': 'sum'
         }).reset_index()
         
-        grouped['Sentiment_Category'] = grouped['Overall_Sentiment'].apply(
-            lambda x: 'Positive' if x > 0.2 else ('Negative' if x < -0.1 else 'Neutral'))
-        
-        for col in ['Overall_Sentiment', 'Polarity', 'Keyword_Sentiment', 'Guidance', 'Risk']:
-            grouped[col] = grouped[col].round(3)
+        conditions = [grouped['Overall_Sentiment'] > 0.2, grouped['Overall_Sentiment'] < -0.1]
+        grouped['Sentiment_Category'] = np.select(conditions, ['Positive', 'Negative'], default='Neutral')
+
+        metric_cols = ['Overall_Sentiment', 'Polarity', 'Keyword_Sentiment', 'Guidance', 'Risk']
+        grouped[metric_cols] = grouped[metric_cols].round(3)
         
         final_cols = ['Company', 'Sector', 'Year', 'Month', 'Overall_Sentiment', 'Sentiment_Category',
                       'Polarity', 'Keyword_Sentiment', 'Guidance', 'Risk', 'File_Count']
@@ -349,96 +633,201 @@ class SentimentAnalyzer:
         final_df = final_df.sort_values(['Company', 'Year', 'Month_Num'], ascending=[True, False, False])
         final_df = final_df.drop(columns=['Month_Num'])
         
-        with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
-            final_df.to_excel(writer, sheet_name='Quarterly Sentiment', index=False)
+        # Parquet is the canonical store; XLSX is an on-demand export artifact
+        try:
+            final_df.to_parquet(self.parquet_file, compression='zstd')
+        except Exception:
+            export_xlsx = True  # no pyarrow — keep the Excel store authoritative
+
+        if export_xlsx:
+            try:
+                with pd.ExcelWriter(self.output_file, engine='xlsxwriter') as writer:
+                    final_df.to_excel(writer, sheet_name='Quarterly Sentiment', index=False)
+            except Exception:
+                with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
+                    final_df.to_excel(writer, sheet_name='Quarterly Sentiment', index=False)
+
+        self._save_pdf_cache()
+
+def _analyze_pdf(pdf_path, company_name, sector, month, year):
+    """
+    Extract and score a single transcript PDF.
+    Top-level function so ProcessPoolExecutor can pickle it; receives the
+    path (not a PDF object) and returns a result dict or None.
+    """
+    _ensure_nlp()  # worker processes import this module fresh
+    raw_text = SentimentAnalyzer.extract_text_from_pdf(pdf_path)
+    if not raw_text or len(raw_text.split()) < 100:
+        return None
+
+    text = SentimentAnalyzer.clean_text(raw_text)
+    # Tokenize and lowercase once; every scorer reuses these
+    n_words = len(text.split())
+    text_lower = text.lower()
+    polarity = SentimentAnalyzer.get_polarity(text, n_words)
+    keyword = SentimentAnalyzer.get_keyword_sentiment(text, text_lower)
+    composite, guidance = SentimentAnalyzer.get_composite_score(polarity, keyword, text, text_lower)
+    risk = round(text_lower.count('risk') / (n_words/1000), 3) if n_words > 0 else 0
+
+    return {
+        'Company': company_name, 'Sector': sector, 'Year': year, 'Month': month,
+        'Overall_Sentiment': composite, 'Polarity': polarity, 'Keyword_Sentiment': keyword,
+        'Guidance': guidance, 'Risk': risk, 'File_Count': 1
+    }
 
 # ==============================================================================
 # HELPER FUNCTIONS FOR DASHBOARD
 # ==============================================================================
+# Processed "latest per company" frame, keyed by the Excel file's mtime so
+# repeated /api/data hits skip the Excel read + groupby entirely.
+_LATEST_CACHE = {'mtime': None, 'latest': None}
+
+def _data_store_mtime():
+    """Most recent mtime across the Parquet store and the Excel export."""
+    parquet_path = OUTPUT_FILE.with_suffix('.parquet')
+    mtimes = [p.stat().st_mtime_ns for p in (parquet_path, OUTPUT_FILE) if p.exists()]
+    return max(mtimes) if mtimes else None
+
 def load_sentiment_data():
-    if not OUTPUT_FILE.exists():
-        return None
+    parquet_path = OUTPUT_FILE.with_suffix('.parquet')
     try:
-        return pd.read_excel(OUTPUT_FILE, sheet_name='Quarterly Sentiment')
+        if parquet_path.exists() and (not OUTPUT_FILE.exists()
+                                      or parquet_path.stat().st_mtime >= OUTPUT_FILE.stat().st_mtime):
+            try:
+                return pd.read_parquet(parquet_path)
+            except Exception:
+                pass
+        if not OUTPUT_FILE.exists():
+            return None
+        df = pd.read_excel(OUTPUT_FILE, sheet_name='Quarterly Sentiment')
+        try:
+            df.to_parquet(parquet_path)
+        except Exception:
+            pass  # pyarrow not installed; keep reading Excel
+        return df
     except:
         return None
 
 def get_latest_sentiment():
+    mtime = _data_store_mtime()
+    if mtime is None:
+        return None
+    if _LATEST_CACHE['mtime'] == mtime:
+        return _LATEST_CACHE['latest']
+
     df = load_sentiment_data()
     if df is None or df.empty:
-        return None
-    month_map = {'Jan':1, 'Feb':2, 'Mar':3, 'Apr':4, 'May':5, 'Jun':6,
-                 'Jul':7, 'Aug':8, 'Sep':9, 'Oct':10, 'Nov':11, 'Dec':12}
-    df['Month_Num'] = df['Month'].map(month_map)
-    df['Sort_Date'] = df['Year'].astype(str) + df['Month_Num'].astype(str).str.zfill(2)
-    return df.sort_values('Sort_Date', ascending=False).groupby('Company').first().reset_index()
+        latest = None
+    else:
+        month_map = {'Jan':1, 'Feb':2, 'Mar':3, 'Apr':4, 'May':5, 'Jun':6,
+                     'Jul':7, 'Aug':8, 'Sep':9, 'Oct':10, 'Nov':11, 'Dec':12}
+        df['Month_Num'] = df['Month'].map(month_map)
+        df['Sort_Key'] = df['Year'].astype(int) * 100 + df['Month_Num']
+        latest = df.sort_values('Sort_Key', ascending=False).groupby('Company').first().reset_index()
+
+    _LATEST_CACHE['mtime'] = mtime
+    _LATEST_CACHE['latest'] = latest
+    return latest
 
 def convert_to_score_100(val):
     return int(round((val + 1) * 50))
 
-def get_top_positive(n=5):
-    latest = get_latest_sentiment()
-    if latest is None:
-        return []
-    top = latest.nlargest(n, 'Overall_Sentiment')
-    return [{'symbol': row['Company'][:3].upper(), 'name': row['Company'], 'sector': row['Sector'],
-             'score': convert_to_score_100(row['Overall_Sentiment'])} for _, row in top.iterrows()]
+# All dashboard aggregates, computed once per data-store version; the public
+# get_* helpers below just read from this
+_AGG_CACHE = {'mtime': None, 'payload': None}
 
-def get_top_negative(n=5):
-    latest = get_latest_sentiment()
-    if latest is None:
-        return []
-    bottom = latest.nsmallest(n, 'Overall_Sentiment')
-    return [{'symbol': row['Company'][:3].upper(), 'name': row['Company'], 'sector': row['Sector'],
-             'score': convert_to_score_100(row['Overall_Sentiment'])} for _, row in bottom.iterrows()]
+def _rank_rows(frame):
+    return [{'symbol': str(escape(row['Company'][:3].upper())), 'name': str(escape(row['Company'])),
+             'sector': str(escape(row['Sector'])),
+             'score': convert_to_score_100(row['Overall_Sentiment'])} for _, row in frame.iterrows()]
 
-def get_sector_leaders():
-    latest = get_latest_sentiment()
+def _compute_aggregates(latest):
     if latest is None:
-        return []
+        return {'top_positive': [], 'top_negative': [], 'sector_leaders': [],
+                'stats': {'total': 0, 'positive': 0, 'negative': 0, 'neutral': 0}}
+
     sector_avg = latest.groupby('Sector')['Overall_Sentiment'].mean().sort_values(ascending=False)
     icons = {'Banking': 'account_balance', 'Finance': 'account_balance', 'Auto': 'directions_car',
              'IT': 'computer', 'Pharma': 'medication', 'Energy': 'bolt', 'Infrastructure': 'factory',
              'FMCG': 'shopping_cart', 'Consumer': 'shopping_cart', 'Unknown': 'analytics'}
     colors = ['indigo', 'orange', 'cyan', 'emerald', 'purple']
-    results = []
-    for i, (sector, score) in enumerate(sector_avg.head(5).items()):
-        results.append({'sector': sector, 'score': round((score + 1) * 50, 1),
-                        'icon': icons.get(sector, 'analytics'), 'color': colors[i % len(colors)]})
-    return results
+    leaders = [{'sector': str(escape(sector)), 'score': round((score + 1) * 50, 1),
+                'icon': icons.get(sector, 'analytics'), 'color': colors[i % len(colors)]}
+               for i, (sector, score) in enumerate(sector_avg.head(5).items())]
 
-def get_summary_stats():
-    latest = get_latest_sentiment()
-    if latest is None:
-        return {'total': 0, 'positive': 0, 'negative': 0, 'neutral': 0}
+    category_counts = latest['Sentiment_Category'].value_counts()
     return {
-        'total': len(latest),
-        'positive': len(latest[latest['Sentiment_Category'] == 'Positive']),
-        'negative': len(latest[latest['Sentiment_Category'] == 'Negative']),
-        'neutral': len(latest[latest['Sentiment_Category'] == 'Neutral']),
+        'top_positive': _rank_rows(latest.nlargest(5, 'Overall_Sentiment')),
+        'top_negative': _rank_rows(latest.nsmallest(5, 'Overall_Sentiment')),
+        'sector_leaders': leaders,
+        'stats': {
+            'total': len(latest),
+            'positive': int(category_counts.get('Positive', 0)),
+            'negative': int(category_counts.get('Negative', 0)),
+            'neutral': int(category_counts.get('Neutral', 0)),
+        },
     }
 
+def _get_aggregates():
+    mtime = _data_store_mtime()
+    if mtime is not None and mtime == _AGG_CACHE['mtime']:
+        return _AGG_CACHE['payload']
+    payload = _compute_aggregates(get_latest_sentiment())
+    _AGG_CACHE['mtime'] = mtime
+    _AGG_CACHE['payload'] = payload
+    return payload
+
+def get_top_positive(n=5):
+    return _get_aggregates()['top_positive'][:n]
+
+def get_top_negative(n=5):
+    return _get_aggregates()['top_negative'][:n]
+
+def get_sector_leaders():
+    return _get_aggregates()['sector_leaders']
+
+def get_summary_stats():
+    return _get_aggregates()['stats']
+
 def read_stock_symbols():
     if not CSV_FILE.exists():
         return []
     df = pd.read_csv(CSV_FILE)
-    stocks = []
-    for _, row in df.iterrows():
-        name = str(row.get('Name', '')).strip()
-        nse = str(row.get('NSE Code', '')).strip()
-        bse = str(row.get('BSE Code', '')).strip()
-        if nse.lower() == 'nan': nse = ''
-        if bse.lower() == 'nan': bse = ''
-        symbol = nse if nse else bse
-        if symbol:
-            stocks.append({'name': name, 'symbol': symbol})
-    return stocks
+    for col in ('Name', 'NSE Code', 'BSE Code'):
+        if col not in df.columns:
+            df[col] = ''
+
+    # Vectorized column cleanup instead of per-row iterrows
+    cols = df[['Name', 'NSE Code', 'BSE Code']].fillna('').astype(str)
+    name = cols['Name'].str.strip()
+    nse = cols['NSE Code'].str.strip()
+    bse = cols['BSE Code'].str.strip()
+    nse = nse.where(nse.str.lower() != 'nan', '')
+    bse = bse.where(bse.str.lower() != 'nan', '')
+
+    stocks = pd.DataFrame({'name': name, 'symbol': np.where(nse != '', nse, bse)})
+    return stocks[stocks['symbol'] != ''].to_dict('records')
 
 # ==============================================================================
 # FLASK APP
 # ==============================================================================
 app = Flask(__name__)
 
+# Optional gzip/brotli response compression; the Tailwind-heavy HTML and the
+# columnar JSON payload both compress 5x+
+try:
+    from flask_compress import Compress
+    Compress(app)
+except ImportError:
+    pass
+
+def _store_etag():
+    """Weak validator derived from the data store's mtime."""
+    mtime = _data_store_mtime()
+    if mtime is None:
+        return None
+    return hashlib.md5(str(mtime).encode()).hexdigest()
+
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html class="dark" lang="en"><head>
 <meta charset="utf-8"/>
@@ -651,23 +1040,13 @@ tailwind.config = {
 <th class="text-left py-3 px-2 font-bold text-slate-300">Risk</th>
 </tr>
 </thead>
-<tbody>
-{% for stock in all_stocks %}
-<tr class="border-b border-slate-700/50 hover:bg-slate-700/30">
-<td class="py-3 px-2 font-bold text-white">{{ stock.Company }}</td>
-<td class="py-3 px-2 text-slate-400">{{ stock.Sector }}</td>
-<td class="py-3 px-2 text-slate-400">{{ stock.Month }} {{ stock.Year }}</td>
-<td class="py-3 px-2"><span class="font-bold {% if stock.Overall_Sentiment > 0.2 %}text-emerald-400{% elif stock.Overall_Sentiment < -0.1 %}text-red-400{% else %}text-amber-400{% endif %}">{{ "%.3f"|format(stock.Overall_Sentiment) }}</span></td>
-<td class="py-3 px-2"><span class="px-2 py-1 rounded text-xs font-bold {% if stock.Sentiment_Category == 'Positive' %}bg-emerald-900/30 text-emerald-400{% elif stock.Sentiment_Category == 'Negative' %}bg-red-900/30 text-red-400{% else %}bg-amber-900/30 text-amber-400{% endif %}">{{ stock.Sentiment_Category }}</span></td>
-<td class="py-3 px-2 text-slate-400">{{ "%.3f"|format(stock.Polarity) }}</td>
-<td class="py-3 px-2 text-slate-400">{{ "%.3f"|format(stock.Keyword_Sentiment) }}</td>
-<td class="py-3 px-2 text-slate-400">{{ "%.1f"|format(stock.Guidance) }}</td>
-<td class="py-3 px-2 text-slate-400">{{ "%.3f"|format(stock.Risk) }}</td>
-</tr>
-{% endfor %}
-{% if not all_stocks %}<tr><td colspan="9" class="py-8 text-center text-slate-500">No data available. Click "Run Analysis" to start.</td></tr>{% endif %}
+<tbody id="stocksBody">
+<tr><td colspan="9" class="py-8 text-center text-slate-500">Loading...</td></tr>
 </tbody>
 </table>
+<div id="loadMoreWrap" class="hidden text-center py-4">
+<button onclick="loadMore()" class="px-4 py-2 rounded bg-slate-700 hover:bg-slate-600 text-slate-200 text-sm font-bold">Load more</button>
+</div>
 </div>
 </div>
 
@@ -676,6 +1055,54 @@ tailwind.config = {
 </main>
 
 <script>
+// The stocks table is hydrated client-side from /api/data in pages of 50,
+// so Jinja never renders the per-row loop and the first paint stays
+// constant-time as the dataset grows
+let stocksOffset = 0;
+
+function renderRows(t, append) {
+    const body = document.getElementById('stocksBody');
+    const c = t.cols;
+    const rows = [];
+    for (let i = 0; i < t.n; i++) {
+        rows.push('<tr class="border-b border-slate-700/50 hover:bg-slate-700/30">'
+            + '<td class="py-3 px-2 font-bold text-white">' + c.Company[i] + '</td>'
+            + '<td class="py-3 px-2 text-slate-400">' + c.Sector[i] + '</td>'
+            + '<td class="py-3 px-2 text-slate-400">' + c.Month[i] + ' ' + c.Year[i] + '</td>'
+            + '<td class="py-3 px-2"><span class="font-bold ' + c.sent_cls[i] + '">' + c.Overall_Sentiment_fmt[i] + '</span></td>'
+            + '<td class="py-3 px-2"><span class="px-2 py-1 rounded text-xs font-bold ' + c.cat_cls[i] + '">' + c.Sentiment_Category[i] + '</span></td>'
+            + '<td class="py-3 px-2 text-slate-400">' + c.Polarity_fmt[i] + '</td>'
+            + '<td class="py-3 px-2 text-slate-400">' + c.Keyword_Sentiment_fmt[i] + '</td>'
+            + '<td class="py-3 px-2 text-slate-400">' + c.Guidance_fmt[i] + '</td>'
+            + '<td class="py-3 px-2 text-slate-400">' + c.Risk_fmt[i] + '</td>'
+            + '</tr>');
+    }
+    if (append) {
+        body.insertAdjacentHTML('beforeend', rows.join(''));
+    } else {
+        body.innerHTML = rows.join('');
+    }
+    stocksOffset = t.offset + t.n;
+    document.getElementById('loadMoreWrap').classList.toggle('hidden', stocksOffset >= t.total);
+}
+
+function loadMore() {
+    fetch('/api/data?offset=' + stocksOffset + '&limit=50')
+        .then(r => r.json())
+        .then(data => renderRows(data.table, true));
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    fetch('/api/data').then(r => r.json()).then(data => {
+        const t = data.table || {n: 0, total: 0};
+        if (!t.n) {
+            document.getElementById('stocksBody').innerHTML = '<tr><td colspan="9" class="py-8 text-center text-slate-500">No data available. Click "Run Analysis" to start.</td></tr>';
+            return;
+        }
+        renderRows(t, false);
+    });
+});
+
 function runAnalysis() {
     const max = prompt("How many stocks to analyze? (Enter number or leave empty for 10)", "10");
     if (max === null) return;
@@ -707,58 +1134,210 @@ function runAnalysis() {
 </body>
 </html>'''
 
+# One-time minification: collapse inter-tag whitespace and leading
+# indentation so each response ships fewer bytes and the Jinja lexer has
+# less to tokenize. The Jinja {% %}/{{ }} constructs sit inside tags and are
+# untouched by the tag-boundary anchors.
+HTML_TEMPLATE = re.sub(r'>\s+<', '><', HTML_TEMPLATE)
+HTML_TEMPLATE = re.sub(r'\n\s+', '\n', HTML_TEMPLATE)
+
+# Compiled once at import: render_template_string re-lexes and re-compiles
+# the Jinja source on every request, which is pure overhead for a constant.
+# Autoescape is off because every interpolated value is escaped once at
+# ingest (see _rank_rows/_table_payload), which beats N markupsafe calls
+# per render; trim/lstrip_blocks simplify the compiled bytecode.
+_JINJA_ENV = jinja2.Environment(autoescape=False, trim_blocks=True,
+                                lstrip_blocks=True, auto_reload=False,
+                                cache_size=400)
+_DASHBOARD_TPL = _JINJA_ENV.from_string(HTML_TEMPLATE)
+
+# Fully rendered page, valid until the data store changes on disk (or an
+# analysis run invalidates it explicitly). The HTML is also spooled to disk
+# so cache hits go through send_file — WSGI servers that support it use
+# sendfile(2) and keep Python out of the response body loop.
+_PAGE_CACHE = {'mtime': None, 'html': None}
+_PAGE_CACHE_FILE = BASE_PATH / '.dashboard_cache.html'
+
 @app.route('/')
 def dashboard():
-    df = load_sentiment_data()
-    all_stocks = df.to_dict('records') if df is not None and not df.empty else []
-    return render_template_string(HTML_TEMPLATE,
+    mtime = _data_store_mtime()
+    etag = _store_etag()
+    if etag and etag in request.if_none_match:
+        return Response(status=304)
+    if mtime is not None and mtime == _PAGE_CACHE['mtime'] and _PAGE_CACHE['html'] is not None:
+        if _PAGE_CACHE_FILE.exists():
+            resp = send_file(_PAGE_CACHE_FILE, mimetype='text/html', conditional=True)
+        else:
+            resp = Response(_PAGE_CACHE['html'], mimetype='text/html')
+        if etag:
+            resp.set_etag(etag)
+            resp.headers['Cache-Control'] = 'public, must-revalidate'
+        return resp
+
+    # Cache miss: stream the template so the browser gets the page head and
+    # summary cards while the rest renders; cache the joined result for the
+    # next hit
+    stream = _DASHBOARD_TPL.stream(
         top_positive=get_top_positive(5),
         top_negative=get_top_negative(5),
         sector_leaders=get_sector_leaders(),
-        stats=get_summary_stats(),
-        all_stocks=all_stocks
+        stats=get_summary_stats()
     )
+    stream.enable_buffering(5)
+
+    def _render_and_cache():
+        chunks = []
+        for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+        html = ''.join(chunks)
+        _PAGE_CACHE['mtime'] = mtime
+        _PAGE_CACHE['html'] = html
+        try:
+            tmp_path = _PAGE_CACHE_FILE.with_suffix('.html.tmp')
+            tmp_path.write_bytes(html.encode())
+            os.replace(tmp_path, _PAGE_CACHE_FILE)
+        except OSError:
+            pass  # read-only filesystem; in-memory cache still serves
+
+    resp = Response(stream_with_context(_render_and_cache()), mimetype='text/html')
+    if etag:
+        resp.set_etag(etag)
+        resp.headers['Cache-Control'] = 'public, must-revalidate'
+    return resp
+
+# Shared worker objects: building the downloader (HTTP session) and analyzer
+# (store + hash-cache load) per request wastes their setup cost. Created
+# lazily so the heavy imports stay deferred until the first analyze run.
+_WORKERS_LOCK = threading.Lock()
+_WORKERS = {'downloader': None, 'analyzer': None}
+
+def _get_workers():
+    with _WORKERS_LOCK:
+        if _WORKERS['downloader'] is None:
+            _WORKERS['downloader'] = ScreenerDownloader(output_folder=DOCUMENTS_ROOT)
+            _WORKERS['analyzer'] = SentimentAnalyzer(pdf_folder=DOCUMENTS_ROOT, output_file=OUTPUT_FILE)
+        return _WORKERS['downloader'], _WORKERS['analyzer']
+
+# Only one analysis run at a time; a second click joins as a no-op rather
+# than doubling the downloader traffic and racing on the output store
+_ANALYZE_LOCK = threading.Lock()
 
 @app.route('/api/analyze')
 def api_analyze():
     max_stocks = int(request.args.get('max', 10))
-    
+
     def generate():
+        if not _ANALYZE_LOCK.acquire(blocking=False):
+            yield f"data: {_dumps({'message': 'An analysis run is already in progress.', 'progress': 0, 'total': 0, 'done': True})}\n\n"
+            return
+        try:
+            yield from _run_analysis(max_stocks)
+        finally:
+            _ANALYZE_LOCK.release()
+
+    def _run_analysis(max_stocks):
         stocks = read_stock_symbols()[:max_stocks]
         total = len(stocks)
-        downloader = ScreenerDownloader(output_folder=DOCUMENTS_ROOT)
-        analyzer = SentimentAnalyzer(pdf_folder=DOCUMENTS_ROOT, output_file=OUTPUT_FILE)
+        downloader, analyzer = _get_workers()
+        analyzer.reset()
         all_results = []
-        
-        for i, stock in enumerate(stocks, 1):
-            symbol = stock['symbol']
-            yield f"data: {json.dumps({'message': f'[{i}/{total}] Processing {symbol}...', 'progress': i, 'total': total, 'done': False})}\n\n"
-            
-            try:
-                downloader.process_company(symbol, 2015, 2025)
-                results = analyzer.process_company(symbol)
-                if results:
-                    all_results.extend(results)
-            except:
-                pass
-            time.sleep(0.5)
-        
+
+        def _process(symbol):
+            downloader.process_company(symbol, 2015, 2025)
+            return analyzer.process_company(symbol)
+
+        # Download + analyze is I/O-bound per stock; overlap a few stocks in
+        # a small thread pool and stream progress as each one completes. The
+        # pool size doubles as the rate limit toward screener.in, replacing
+        # the old fixed 0.5s sleep between stocks. The shared downloader's
+        # session stays open for the next run.
+        # Pre-built SSE frame with total baked in: only the message and
+        # progress vary per event, so no 4-key dict is rebuilt and re-walked
+        # by the serializer each tick
+        frame = 'data: {"message": %%s, "progress": %%d, "total": %d, "done": false}\n\n' % total
+        yield frame % (_dumps(f'Processing {total} stocks...'), 0)
+        last_flush = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(4, max(1, total))) as pool:
+            futures = {pool.submit(_process, stock['symbol']): stock['symbol'] for stock in stocks}
+            for i, future in enumerate(as_completed(futures), 1):
+                symbol = futures[future]
+                try:
+                    results = future.result()
+                    if results:
+                        all_results.extend(results)
+                except:
+                    pass
+                # Batch progress flushes: one event per 5 completions or
+                # 250ms, whichever comes first, so big runs don't pay a
+                # socket write and client reflow per stock
+                if i == total or i % 5 == 0 or (time.monotonic() - last_flush) > 0.25:
+                    last_flush = time.monotonic()
+                    yield frame % (_dumps(f'[{i}/{total}] Processed {symbol}'), i)
+
         if all_results:
             analyzer.combine_and_save(all_results)
-        
-        yield f"data: {json.dumps({'message': f'Complete! Analyzed {total} stocks.', 'progress': total, 'total': total, 'done': True})}\n\n"
-    
-    import json
+        _PAGE_CACHE['mtime'] = None  # force a fresh render after the run
+
+        yield f"data: {_dumps({'message': f'Complete! Analyzed {total} stocks.', 'progress': total, 'total': total, 'done': True})}\n\n"
+
     return Response(generate(), mimetype='text/event-stream')
 
+_CATEGORY_CLASSES = {
+    'Positive': 'bg-emerald-900/30 text-emerald-400',
+    'Negative': 'bg-red-900/30 text-red-400',
+    'Neutral': 'bg-amber-900/30 text-amber-400',
+}
+
+def _table_payload(df, offset=0, limit=50):
+    """Column-oriented table data: N lists instead of N row dicts, with float
+    display strings pre-formatted in one vectorized pass per column. Sliced
+    by offset/limit so the payload stays constant-size as the store grows."""
+    if df is None or df.empty:
+        return {'n': 0, 'total': 0, 'offset': 0, 'cols': {}}
+    total = len(df)
+    df = df.iloc[offset:offset + limit]
+    # Company/Sector are the only free-text fields; escape them here since
+    # the client inserts rows with innerHTML and the page template doesn't
+    # autoescape
+    cols = {c: df[c].tolist() for c in ('Month', 'Year', 'Sentiment_Category')}
+    cols['Company'] = [str(escape(v)) for v in df['Company'].tolist()]
+    cols['Sector'] = [str(escape(v)) for v in df['Sector'].tolist()]
+    # CSS classes resolved here in one numpy pass / one map, so the client
+    # render loop is branch-free string concatenation
+    cols['sent_cls'] = np.where(df['Overall_Sentiment'] > 0.2, 'text-emerald-400',
+                                np.where(df['Overall_Sentiment'] < -0.1, 'text-red-400',
+                                         'text-amber-400')).tolist()
+    cols['cat_cls'] = df['Sentiment_Category'].map(_CATEGORY_CLASSES).fillna(
+        _CATEGORY_CLASSES['Neutral']).tolist()
+    cols['Overall_Sentiment_fmt'] = df['Overall_Sentiment'].map('{:.3f}'.format).tolist()
+    cols['Polarity_fmt'] = df['Polarity'].map('{:.3f}'.format).tolist()
+    cols['Keyword_Sentiment_fmt'] = df['Keyword_Sentiment'].map('{:.3f}'.format).tolist()
+    cols['Guidance_fmt'] = df['Guidance'].map('{:.1f}'.format).tolist()
+    cols['Risk_fmt'] = df['Risk'].map('{:.3f}'.format).tolist()
+    return {'n': int(len(df)), 'total': int(total), 'offset': int(offset), 'cols': cols}
+
 @app.route('/api/data')
 def api_data():
-    return jsonify({
+    etag = _store_etag()
+    if etag and etag in request.if_none_match:
+        return Response(status=304)
+    try:
+        offset = max(0, int(request.args.get('offset', 0)))
+        limit = min(500, max(1, int(request.args.get('limit', 50))))
+    except ValueError:
+        offset, limit = 0, 50
+    resp = _json_response({
         'top_positive': get_top_positive(5),
         'top_negative': get_top_negative(5),
         'sector_leaders': get_sector_leaders(),
-        'stats': get_summary_stats()
+        'stats': get_summary_stats(),
+        'table': _table_payload(load_sentiment_data(), offset, limit)
     })
+    if etag:
+        resp.set_etag(etag)
+        resp.headers['Cache-Control'] = 'public, must-revalidate'
+    return resp
 
 if __name__ == "__main__":
     print("\n" + "=" * 60)
@@ -767,4 +1346,18 @@ if __name__ == "__main__":
     print(f" Dashboard: http://localhost:5001")
     print(f" Data File: {OUTPUT_FILE}")
     print("=" * 60 + "\n")
-    app.run(host='0.0.0.0', port=5001, debug=True, threaded=True)
+
+    # Prefer a real WSGI container: threaded gunicorn workers keep one slow
+    # request from blocking the whole dashboard. Falls back to the Flask dev
+    # server when gunicorn isn't installed.
+    import shutil
+    gunicorn = shutil.which('gunicorn')
+    if gunicorn:
+        import subprocess
+        subprocess.run([gunicorn, '--workers', '4', '--worker-class', 'gthread',
+                        '--threads', '8', '--bind', '0.0.0.0:5001', 'sentiment_app:app'])
+    else:
+        # Werkzeug dev server fallback; the debugger/reloader add large
+        # per-request overhead, so they stay off unless explicitly requested
+        app.run(host='0.0.0.0', port=5001,
+                debug=bool(os.environ.get('FLASK_DEBUG')), threaded=True)
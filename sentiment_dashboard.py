@@ -11,95 +11,162 @@ Then open: http://localhost:5001
 import os
 import sys
 from pathlib import Path
-from flask import Flask, render_template_string, jsonify
+from flask import Flask, jsonify, request, Response, stream_with_context
 import pandas as pd
 import numpy as np
 
 app = Flask(__name__)
 
+try:
+    import orjson
+
+    def _json_response(obj):
+        return Response(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+                        mimetype='application/json')
+except ImportError:
+    orjson = None
+
+    def _json_response(obj):
+        return jsonify(obj)
+
+try:
+    from flask_compress import Compress
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)  # gzip/brotli: the all-stocks table compresses ~8x
+except ImportError:
+    pass
+
 # ==================== CONFIGURATION ====================
 BASE_PATH = Path(__file__).parent
 EXCEL_FILE = BASE_PATH / "indian_stock_analysis_output.xlsx"
 
 # ==================== DATA LOADING ====================
-def load_sentiment_data():
-    """Load sentiment data from Excel file"""
-    if not EXCEL_FILE.exists():
+# Parsed workbook and the derived latest-per-company frame, keyed on the
+# Excel file's (mtime_ns, size). A single dashboard render calls the get_*
+# helpers 5+ times; without this every call re-parses the workbook.
+_CACHE = {'key': None, 'df': None, 'latest': None}
+
+def _cache_key():
+    try:
+        st = EXCEL_FILE.stat()
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
         return None
+
+_MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+           'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Only the columns the template and helpers actually touch; usecols lets
+# the engine skip cells in every other column
+_USED_COLS = ['Company', 'Sector', 'Month', 'Year', 'Overall_Sentiment',
+              'Sentiment_Category', 'Polarity', 'Keyword_Sentiment',
+              'Guidance', 'Risk']
+
+def _read_workbook():
+    # calamine parses the XLSX in Rust, roughly halving parse time; fall
+    # back to openpyxl's read-only streaming mode (no style parsing) when
+    # it isn't installed
     try:
-        df = pd.read_excel(EXCEL_FILE, sheet_name='Quarterly Sentiment')
-        return df
-    except Exception as e:
-        print(f"Error loading data: {e}")
+        return pd.read_excel(EXCEL_FILE, sheet_name='Quarterly Sentiment', engine='calamine',
+                             usecols=_USED_COLS)
+    except (ImportError, ValueError):
+        return pd.read_excel(EXCEL_FILE, sheet_name='Quarterly Sentiment', engine='openpyxl',
+                             engine_kwargs={'read_only': True, 'data_only': True},
+                             usecols=_USED_COLS)
+
+def load_sentiment_data():
+    """Load sentiment data from Excel file (cached until the file changes)"""
+    key = _cache_key()
+    if key is None:
         return None
+    if _CACHE['key'] == key:
+        return _CACHE['df']
+
+    # Parquet sidecar: across process restarts a fresh sidecar skips the
+    # Excel parse entirely (binary columnar read, no XML work)
+    parquet = EXCEL_FILE.with_suffix('.parquet')
+    df = None
+    try:
+        if parquet.exists() and parquet.stat().st_mtime >= EXCEL_FILE.stat().st_mtime:
+            df = pd.read_parquet(parquet, columns=_USED_COLS)
+    except Exception:
+        df = None
+
+    if df is None:
+        try:
+            df = _read_workbook()
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return None
+        try:
+            df.to_parquet(parquet, compression='zstd')
+        except Exception:
+            pass  # pyarrow not installed; the in-memory cache still helps
+
+    # Categorical codes turn the repeated string columns into int8
+    # compares (value_counts, groupby) and shrink them ~10x
+    for col in ('Sentiment_Category', 'Sector'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    # Ordered month categories: cat.codes + 1 gives the month number
+    # with no per-row dict lookup
+    if 'Month' in df.columns:
+        df['Month'] = pd.Categorical(df['Month'], categories=_MONTHS, ordered=True)
+    # Scores carry 3 decimals in [-1, 1]; float32 halves the bytes the
+    # mean/histogram/ranking ops pull through memory
+    for col in ('Overall_Sentiment', 'Polarity', 'Keyword_Sentiment', 'Guidance', 'Risk'):
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32)
+    if 'Year' in df.columns:
+        df['Year'] = df['Year'].astype(np.int16)
+
+    _CACHE['key'] = key
+    _CACHE['df'] = df
+    _CACHE['latest'] = None
+    return df
 
 def get_latest_sentiment():
     """Get the latest sentiment score for each company"""
     df = load_sentiment_data()
     if df is None or df.empty:
         return None
-    
+    if _CACHE['latest'] is not None:
+        return _CACHE['latest']
+
     # Convert to proper date for sorting
-    month_map = {'Jan':1, 'Feb':2, 'Mar':3, 'Apr':4, 'May':5, 'Jun':6, 
-                 'Jul':7, 'Aug':8, 'Sep':9, 'Oct':10, 'Nov':11, 'Dec':12}
-    df['Month_Num'] = df['Month'].map(month_map)
-    df['Sort_Date'] = df['Year'].astype(str) + df['Month_Num'].astype(str).str.zfill(2)
-    
-    # Get latest entry per company
-    latest = df.sort_values('Sort_Date', ascending=False).groupby('Company').first().reset_index()
+    df['Month_Num'] = (df['Month'].cat.codes.astype(np.int16) + 1)
+    df['Sort_Date'] = (df['Year'].to_numpy(dtype=np.int32) * 100
+                       + df['Month_Num'].to_numpy(dtype=np.int32))
+
+    # Get latest entry per company without sorting the whole frame
+    latest = df.loc[df.groupby('Company', sort=False)['Sort_Date'].idxmax()].reset_index(drop=True)
+    # 0-100 score once for the whole column; the ranking loops just read it
+    latest['Score100'] = ((latest['Overall_Sentiment'].to_numpy() + 1.0) * 50.0).round().astype(np.int16)
+    _CACHE['latest'] = latest
     return latest
 
 def convert_to_score_100(sentiment_value):
     """Convert -1 to 1 sentiment to 0-100 scale"""
     return int(round((sentiment_value + 1) * 50))
 
-def get_top_positive(n=5):
-    """Get top N positive sentiment stocks"""
-    latest = get_latest_sentiment()
-    if latest is None:
-        return []
-    
-    top = latest.nlargest(n, 'Overall_Sentiment')
-    results = []
-    for _, row in top.iterrows():
-        results.append({
-            'symbol': row['Company'][:3].upper(),
-            'name': row['Company'],
-            'sector': row['Sector'],
-            'score': convert_to_score_100(row['Overall_Sentiment']),
-            'raw_score': round(row['Overall_Sentiment'], 3)
-        })
-    return results
-
-def get_top_negative(n=5):
-    """Get top N negative sentiment stocks"""
-    latest = get_latest_sentiment()
-    if latest is None:
-        return []
-    
-    bottom = latest.nsmallest(n, 'Overall_Sentiment')
+def _rank_rows(frame):
     results = []
-    for _, row in bottom.iterrows():
+    for row in frame.itertuples(index=False):
         results.append({
-            'symbol': row['Company'][:3].upper(),
-            'name': row['Company'],
-            'sector': row['Sector'],
-            'score': convert_to_score_100(row['Overall_Sentiment']),
-            'raw_score': round(row['Overall_Sentiment'], 3)
+            'symbol': row.Company[:3].upper(),
+            'name': row.Company,
+            'sector': row.Sector,
+            'score': int(row.Score100),
+            'raw_score': round(row.Overall_Sentiment, 3)
         })
     return results
 
-def get_sector_leaders():
-    """Get average sentiment by sector"""
-    latest = get_latest_sentiment()
-    if latest is None:
-        return []
-    
+def _sector_leaders(latest):
     sector_avg = latest.groupby('Sector')['Overall_Sentiment'].mean().sort_values(ascending=False)
     results = []
     icons = {
         'Banking': 'account_balance', 'Finance': 'account_balance',
-        'Auto': 'directions_car', 'IT': 'computer', 
+        'Auto': 'directions_car', 'IT': 'computer',
         'Pharma': 'medication', 'Healthcare': 'local_hospital',
         'Energy': 'bolt', 'Power': 'bolt',
         'Infrastructure': 'factory', 'Metals': 'factory',
@@ -108,7 +175,7 @@ def get_sector_leaders():
         'Unknown': 'analytics'
     }
     colors = ['indigo', 'orange', 'cyan', 'emerald', 'purple']
-    
+
     for i, (sector, score) in enumerate(sector_avg.head(5).items()):
         results.append({
             'sector': sector,
@@ -119,40 +186,100 @@ def get_sector_leaders():
         })
     return results
 
+def _distribution(latest):
+    # Create bins from -1 to 1, vectorized end to end
+    values = latest['Overall_Sentiment'].to_numpy(dtype=np.float64)
+    hist, _ = np.histogram(values, bins=np.linspace(-1, 1, 11))
+    heights = (hist * 100 // max(hist.max(), 1)).astype(np.int32)
+    idx = np.arange(10)
+    colors = np.where(idx < 4, 'red', np.where(idx < 6, 'amber', 'emerald'))
+    return [{'bin': int(i), 'count': int(c), 'height': int(h), 'color': str(col)}
+            for i, c, h, col in zip(idx, hist, heights, colors)]
+
+def _summary_stats(latest):
+    category_counts = latest['Sentiment_Category'].value_counts()
+    return {
+        'total': len(latest),
+        'positive': int(category_counts.get('Positive', 0)),
+        'negative': int(category_counts.get('Negative', 0)),
+        'neutral': int(category_counts.get('Neutral', 0)),
+        'avg_sentiment': round(latest['Overall_Sentiment'].mean(), 3)
+    }
+
+def build_dashboard_payload(n=5):
+    """Derive every dashboard aggregate from one latest-per-company frame.
+
+    One sort of Overall_Sentiment serves both the positive and negative
+    rankings; the groupby/sort behind get_latest_sentiment runs once
+    instead of once per helper.
+    """
+    latest = get_latest_sentiment()
+    if latest is None:
+        return {
+            'top_positive': [], 'top_negative': [], 'sector_leaders': [],
+            'distribution': [],
+            'stats': {'total': 0, 'positive': 0, 'negative': 0, 'neutral': 0},
+        }
+    ordered = latest.sort_values('Overall_Sentiment')
+    return {
+        'top_positive': _rank_rows(ordered.tail(n).iloc[::-1]),
+        'top_negative': _rank_rows(ordered.head(n)),
+        'sector_leaders': _sector_leaders(latest),
+        'distribution': _distribution(latest),
+        'stats': _summary_stats(latest),
+    }
+
+_CATEGORY_CLASSES = {
+    'Positive': 'bg-emerald-100 text-emerald-700 dark:bg-emerald-900/30 dark:text-emerald-400',
+    'Negative': 'bg-red-100 text-red-700 dark:bg-red-900/30 dark:text-red-400',
+}
+_NEUTRAL_CLASS = 'bg-amber-100 text-amber-700 dark:bg-amber-900/30 dark:text-amber-400'
+
+def _table_rows(df):
+    """Pre-format the all-stocks table with vectorized pandas ops.
+
+    itertuples hands Jinja lightweight namedtuples instead of one dict
+    per row, and the number formatting / CSS class picks happen once in
+    C rather than per cell in the template.
+    """
+    view = df[['Company', 'Sector', 'Month', 'Year', 'Sentiment_Category']].copy()
+    sent = df['Overall_Sentiment']
+    view['Sentiment_fmt'] = sent.map('{:.3f}'.format)
+    view['sent_cls'] = np.where(sent > 0.2, 'text-emerald-600',
+                                np.where(sent < -0.1, 'text-red-600', 'text-amber-600'))
+    view['cat_cls'] = view['Sentiment_Category'].astype(str).map(_CATEGORY_CLASSES).fillna(_NEUTRAL_CLASS)
+    view['Polarity_fmt'] = df['Polarity'].map('{:.3f}'.format)
+    view['Keyword_fmt'] = df['Keyword_Sentiment'].map('{:.3f}'.format)
+    view['Guidance_fmt'] = df['Guidance'].map('{:.1f}'.format)
+    view['Risk_fmt'] = df['Risk'].map('{:.3f}'.format)
+    return list(view.itertuples(index=False, name='Row'))
+
+def get_top_positive(n=5):
+    """Get top N positive sentiment stocks"""
+    latest = get_latest_sentiment()
+    return [] if latest is None else _rank_rows(latest.nlargest(n, 'Overall_Sentiment'))
+
+def get_top_negative(n=5):
+    """Get top N negative sentiment stocks"""
+    latest = get_latest_sentiment()
+    return [] if latest is None else _rank_rows(latest.nsmallest(n, 'Overall_Sentiment'))
+
+def get_sector_leaders():
+    """Get average sentiment by sector"""
+    latest = get_latest_sentiment()
+    return [] if latest is None else _sector_leaders(latest)
+
 def get_distribution_data():
     """Get sentiment distribution for histogram"""
     latest = get_latest_sentiment()
-    if latest is None:
-        return []
-    
-    # Create bins from -1 to 1
-    bins = np.linspace(-1, 1, 11)
-    hist, edges = np.histogram(latest['Overall_Sentiment'], bins=bins)
-    
-    max_count = max(hist) if len(hist) > 0 else 1
-    results = []
-    for i, count in enumerate(hist):
-        results.append({
-            'bin': i,
-            'count': int(count),
-            'height': int((count / max_count) * 100) if max_count > 0 else 0,
-            'color': 'red' if i < 4 else ('amber' if i < 6 else 'emerald')
-        })
-    return results
+    return [] if latest is None else _distribution(latest)
 
 def get_summary_stats():
     """Get summary statistics"""
     latest = get_latest_sentiment()
     if latest is None:
         return {'total': 0, 'positive': 0, 'negative': 0, 'neutral': 0}
-    
-    return {
-        'total': len(latest),
-        'positive': len(latest[latest['Sentiment_Category'] == 'Positive']),
-        'negative': len(latest[latest['Sentiment_Category'] == 'Negative']),
-        'neutral': len(latest[latest['Sentiment_Category'] == 'Neutral']),
-        'avg_sentiment': round(latest['Overall_Sentiment'].mean(), 3)
-    }
+    return _summary_stats(latest)
 
 # ==================== HTML TEMPLATE ====================
 HTML_TEMPLATE = '''<!DOCTYPE html>
@@ -362,19 +489,15 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 <td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ stock.Sector }}</td>
 <td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ stock.Month }} {{ stock.Year }}</td>
 <td class="py-3 px-2">
-<span class="font-bold {% if stock.Overall_Sentiment > 0.2 %}text-emerald-600{% elif stock.Overall_Sentiment < -0.1 %}text-red-600{% else %}text-amber-600{% endif %}">
-{{ "%.3f"|format(stock.Overall_Sentiment) }}
-</span>
+<span class="font-bold {{ stock.sent_cls }}">{{ stock.Sentiment_fmt }}</span>
 </td>
 <td class="py-3 px-2">
-<span class="px-2 py-1 rounded text-xs font-bold {% if stock.Sentiment_Category == 'Positive' %}bg-emerald-100 text-emerald-700 dark:bg-emerald-900/30 dark:text-emerald-400{% elif stock.Sentiment_Category == 'Negative' %}bg-red-100 text-red-700 dark:bg-red-900/30 dark:text-red-400{% else %}bg-amber-100 text-amber-700 dark:bg-amber-900/30 dark:text-amber-400{% endif %}">
-{{ stock.Sentiment_Category }}
-</span>
+<span class="px-2 py-1 rounded text-xs font-bold {{ stock.cat_cls }}">{{ stock.Sentiment_Category }}</span>
 </td>
-<td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ "%.3f"|format(stock.Polarity) }}</td>
-<td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ "%.3f"|format(stock.Keyword_Sentiment) }}</td>
-<td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ "%.1f"|format(stock.Guidance) }}</td>
-<td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ "%.3f"|format(stock.Risk) }}</td>
+<td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ stock.Polarity_fmt }}</td>
+<td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ stock.Keyword_fmt }}</td>
+<td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ stock.Guidance_fmt }}</td>
+<td class="py-3 px-2 text-slate-600 dark:text-slate-400">{{ stock.Risk_fmt }}</td>
 </tr>
 {% endfor %}
 </tbody>
@@ -389,38 +512,82 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 </body>
 </html>'''
 
+ERROR_HTML = '''
+<html><body style="font-family:sans-serif;text-align:center;padding:50px">
+<h1>No Data Available</h1>
+<p>Please run batch_stock_analyzer.py first to generate sentiment data.</p>
+<p>Expected file: <code>{{ file }}</code></p>
+</body></html>
+'''
+
+# Compiled once at import; render_template_string would re-hash the
+# template string on every request to find it in Jinja's cache
+DASHBOARD_TPL = app.jinja_env.from_string(HTML_TEMPLATE)
+ERROR_TPL = app.jinja_env.from_string(ERROR_HTML)
+
 # ==================== ROUTES ====================
+# Rendered page bytes keyed on the workbook's mtime_ns; the row loop in
+# HTML_TEMPLATE dominates render cost, so between file updates only the
+# first hit pays it.
+_HTML_CACHE = {'mtime': None, 'html': None}
+
 @app.route('/')
 def dashboard():
     """Main dashboard page"""
+    try:
+        mtime = EXCEL_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    etag = f'"{mtime}"'
+    if mtime is not None and request.headers.get('If-None-Match') == etag:
+        return '', 304
+
+    if mtime is not None and _HTML_CACHE['mtime'] == mtime:
+        resp = Response(_HTML_CACHE['html'])
+        resp.headers['ETag'] = etag
+        resp.headers['Cache-Control'] = 'max-age=60'
+        return resp
+
     df = load_sentiment_data()
-    
+
     if df is None or df.empty:
-        return render_template_string('''
-        <html><body style="font-family:sans-serif;text-align:center;padding:50px">
-        <h1>No Data Available</h1>
-        <p>Please run batch_stock_analyzer.py first to generate sentiment data.</p>
-        <p>Expected file: <code>{{ file }}</code></p>
-        </body></html>
-        ''', file=str(EXCEL_FILE))
-    
-    return render_template_string(
-        HTML_TEMPLATE,
-        top_positive=get_top_positive(5),
-        top_negative=get_top_negative(5),
-        sector_leaders=get_sector_leaders(),
-        stats=get_summary_stats(),
-        all_stocks=df.to_dict('records')
+        return ERROR_TPL.render(file=str(EXCEL_FILE))
+
+    payload = build_dashboard_payload(5)
+    # Stream the render: the client gets the page head while the row
+    # loop is still running, and no full-page string is built up front
+    stream = DASHBOARD_TPL.stream(
+        top_positive=payload['top_positive'],
+        top_negative=payload['top_negative'],
+        sector_leaders=payload['sector_leaders'],
+        stats=payload['stats'],
+        all_stocks=_table_rows(df)
     )
+    stream.enable_buffering(5)
+
+    def _render_and_cache():
+        chunks = []
+        for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+        if mtime is not None:
+            _HTML_CACHE['mtime'] = mtime
+            _HTML_CACHE['html'] = ''.join(chunks)
+
+    resp = Response(stream_with_context(_render_and_cache()), mimetype='text/html')
+    resp.headers['ETag'] = etag
+    resp.headers['Cache-Control'] = 'max-age=60'
+    return resp
 
 @app.route('/api/data')
 def api_data():
     """API endpoint for raw data"""
-    return jsonify({
-        'top_positive': get_top_positive(5),
-        'top_negative': get_top_negative(5),
-        'sector_leaders': get_sector_leaders(),
-        'stats': get_summary_stats()
+    payload = build_dashboard_payload(5)
+    return _json_response({
+        'top_positive': payload['top_positive'],
+        'top_negative': payload['top_negative'],
+        'sector_leaders': payload['sector_leaders'],
+        'stats': payload['stats']
     })
 
 # ==================== MAIN ====================
@@ -432,4 +599,8 @@ if __name__ == "__main__":
     print(f" URL: http://localhost:5001")
     print("=" * 60 + "\n")
     
-    app.run(host='0.0.0.0', port=5001, debug=True)
+    # For real load run under a WSGI server instead, e.g.:
+    #   gunicorn -w 4 -k gthread sentiment_dashboard:app
+    # Each worker shares the workbook via the mtime-keyed cache.
+    DEBUG = os.environ.get('DASH_DEBUG') == '1'
+    app.run(host='0.0.0.0', port=5001, debug=DEBUG, use_reloader=False, threaded=True)
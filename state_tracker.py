@@ -3,14 +3,32 @@ State Tracker
 =============
 Tracks processing state for incremental updates.
 Only processes new/unprocessed company-quarter combinations.
+
+State lives in a SQLite database (WAL mode): lookups are indexed B-tree
+reads and marks are single-row writes, so startup and per-mark cost stay
+constant as the state grows. A legacy processing_state.json is imported
+once on first open.
 """
 
 import json
 import logging
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+try:
+    import orjson
+
+    def _dump_meta(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    orjson = None
+
+    def _dump_meta(obj) -> str:
+        return json.dumps(obj)
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -20,243 +38,258 @@ class StateTracker:
     Tracks which company-quarter combinations have been processed.
     Enables incremental updates (only new data) and force full re-runs.
     """
-    
+
     def __init__(self, state_file: str = None):
         """
         Initialize the state tracker.
-        
+
         Args:
-            state_file: Path to JSON state file (default: processing_state.json)
+            state_file: Path to the legacy JSON state file (default:
+                processing_state.json); the SQLite store lives next to it
+                with a .db suffix
         """
         base_path = Path(__file__).parent
         self.state_file = Path(state_file) if state_file else base_path / "processing_state.json"
-        
-        self.state = self._load_state()
-    
-    def _load_state(self) -> Dict:
-        """Load state from JSON file."""
+        self.db_file = self.state_file.with_suffix('.db')
+
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS processed('
+            'company TEXT, quarter TEXT, ts TEXT, meta TEXT, '
+            'PRIMARY KEY(company, quarter))'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS runs('
+            'run_type TEXT PRIMARY KEY, ts TEXT, stats TEXT)'
+        )
+        self.conn.commit()
+        self._migrate_legacy_json()
+
+        # Flattened {(COMPANY, quarter)} view for get_unprocessed;
+        # rebuilt lazily after any mutation
+        self._flat_cache = None
+        # batch() flips _autocommit off so a hot mark_processed loop
+        # commits once at the end instead of once per item
+        self._autocommit = True
+
+    def _migrate_legacy_json(self):
+        """Import an existing processing_state.json into an empty db."""
         if not self.state_file.exists():
-            return {
-                'processed': {},  # {company: {quarter: timestamp}}
-                'last_full_run': None,
-                'last_incremental_run': None,
-                'stats': {
-                    'total_processed': 0,
-                    'total_companies': 0
-                }
-            }
-        
+            return
+        if self.conn.execute('SELECT 1 FROM processed LIMIT 1').fetchone():
+            return
         try:
             with open(self.state_file, 'r') as f:
-                return json.load(f)
+                state = json.load(f)
         except Exception as e:
-            logger.error(f"Error loading state: {e}")
-            return {
-                'processed': {},
-                'last_full_run': None,
-                'last_incremental_run': None,
-                'stats': {'total_processed': 0, 'total_companies': 0}
-            }
-    
-    def _save_state(self):
-        """Save state to JSON file."""
+            logger.error(f"Error loading legacy state: {e}")
+            return
+
+        rows = [
+            (company, quarter, entry.get('timestamp'), _dump_meta(entry.get('metadata') or {}))
+            for company, quarters in state.get('processed', {}).items()
+            for quarter, entry in quarters.items()
+        ]
+        if rows:
+            self.conn.executemany('INSERT OR REPLACE INTO processed VALUES(?,?,?,?)', rows)
+        for key, legacy in (('full', 'last_full_run'), ('incremental', 'last_incremental_run')):
+            run = state.get(legacy)
+            if run:
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO runs VALUES(?,?,?)',
+                    (key, run.get('timestamp'), _dump_meta(run.get('stats') or {})))
+        self.conn.commit()
+        if rows:
+            logger.info(f"Migrated {len(rows)} entries from {self.state_file.name}")
+
+    def _commit(self):
+        """Commit now, or defer until the surrounding batch() exits."""
+        if self._autocommit:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        """Defer commits until the block exits.
+
+        Usage:
+            with tracker.batch():
+                for company, quarter in work:
+                    tracker.mark_processed(company, quarter)
+        """
+        self._autocommit = False
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving state: {e}")
-    
+            yield self
+        finally:
+            self._autocommit = True
+            self.conn.commit()
+
+    @property
+    def _flat_set(self) -> Set[Tuple[str, str]]:
+        """Set of (COMPANY, quarter) pairs for O(1) membership tests."""
+        if self._flat_cache is None:
+            self._flat_cache = set(
+                self.conn.execute('SELECT company, quarter FROM processed'))
+        return self._flat_cache
+
     def is_processed(self, company: str, quarter: str) -> bool:
         """
         Check if a company-quarter combination has been processed.
-        
+
         Args:
             company: Company NSE code
             quarter: Quarter string (e.g., "Jan_2024" or "Q3_2024")
-            
+
         Returns:
             True if already processed
         """
-        company_state = self.state.get('processed', {}).get(company.upper(), {})
-        return quarter in company_state
-    
+        row = self.conn.execute(
+            'SELECT 1 FROM processed WHERE company=? AND quarter=? LIMIT 1',
+            (company.upper(), quarter)).fetchone()
+        return row is not None
+
     def mark_processed(self, company: str, quarter: str, metadata: Dict = None):
         """
         Mark a company-quarter as processed.
-        
+
         Args:
             company: Company NSE code
             quarter: Quarter string
             metadata: Optional metadata to store (e.g., sentiment scores)
         """
-        company_upper = company.upper()
-        
-        if 'processed' not in self.state:
-            self.state['processed'] = {}
-        
-        if company_upper not in self.state['processed']:
-            self.state['processed'][company_upper] = {}
-        
-        self.state['processed'][company_upper][quarter] = {
-            'timestamp': datetime.now().isoformat(),
-            'metadata': metadata or {}
-        }
-        
-        # Update stats
-        self._update_stats()
-        self._save_state()
-    
+        self.conn.execute(
+            'INSERT OR REPLACE INTO processed VALUES(?,?,?,?)',
+            (company.upper(), quarter, datetime.now().isoformat(),
+             _dump_meta(metadata or {})))
+        self._flat_cache = None
+        self._commit()
+
     def mark_batch_processed(self, items: List[Tuple[str, str, Dict]]):
         """
-        Mark multiple items as processed in one save operation.
-        
+        Mark multiple items as processed in one transaction.
+
         Args:
             items: List of (company, quarter, metadata) tuples
         """
-        for company, quarter, metadata in items:
-            company_upper = company.upper()
-            
-            if 'processed' not in self.state:
-                self.state['processed'] = {}
-            
-            if company_upper not in self.state['processed']:
-                self.state['processed'][company_upper] = {}
-            
-            self.state['processed'][company_upper][quarter] = {
-                'timestamp': datetime.now().isoformat(),
-                'metadata': metadata or {}
-            }
-        
-        self._update_stats()
-        self._save_state()
-    
-    def _update_stats(self):
-        """Update processing statistics."""
-        processed = self.state.get('processed', {})
-        
-        total_items = sum(len(quarters) for quarters in processed.values())
-        total_companies = len(processed)
-        
-        self.state['stats'] = {
-            'total_processed': total_items,
-            'total_companies': total_companies
-        }
-    
+        ts = datetime.now().isoformat()
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO processed VALUES(?,?,?,?)',
+            [(company.upper(), quarter, ts, _dump_meta(metadata or {}))
+             for company, quarter, metadata in items])
+        self._flat_cache = None
+        self._commit()
+
     def get_unprocessed(self, available: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
         """
         Filter out already processed items.
-        
+
         Args:
             available: List of (company, quarter) tuples to check
-            
+
         Returns:
             List of unprocessed (company, quarter) tuples
         """
-        unprocessed = []
-        
-        for company, quarter in available:
-            if not self.is_processed(company, quarter):
-                unprocessed.append((company, quarter))
-        
-        return unprocessed
-    
+        ps = self._flat_set
+        return [(company, quarter) for company, quarter in available
+                if (company.upper(), quarter) not in ps]
+
+    def get_processed_set(self, company: str) -> frozenset:
+        """
+        Get a company's processed quarters as a frozenset.
+
+        One indexed query per company; callers can then test quarters
+        with O(1) membership instead of one is_processed round-trip each.
+        """
+        return frozenset(row[0] for row in self.conn.execute(
+            'SELECT quarter FROM processed WHERE company=?', (company.upper(),)))
+
     def get_processed_quarters(self, company: str) -> List[str]:
         """Get list of processed quarters for a company."""
-        company_upper = company.upper()
-        return list(self.state.get('processed', {}).get(company_upper, {}).keys())
-    
+        return [row[0] for row in self.conn.execute(
+            'SELECT quarter FROM processed WHERE company=?', (company.upper(),))]
+
     def get_company_status(self, company: str) -> Dict:
         """Get processing status for a company."""
         company_upper = company.upper()
-        quarters = self.state.get('processed', {}).get(company_upper, {})
-        
+        rows = self.conn.execute(
+            'SELECT quarter, ts FROM processed WHERE company=?',
+            (company_upper,)).fetchall()
+
         return {
             'company': company_upper,
-            'quarters_processed': len(quarters),
-            'quarters': list(quarters.keys()),
-            'last_processed': max(
-                (q['timestamp'] for q in quarters.values()),
-                default=None
-            ) if quarters else None
+            'quarters_processed': len(rows),
+            'quarters': [q for q, _ in rows],
+            'last_processed': max((ts for _, ts in rows), default=None) if rows else None
         }
-    
+
     def clear_company(self, company: str):
         """Clear processing state for a specific company."""
         company_upper = company.upper()
-        
-        if company_upper in self.state.get('processed', {}):
-            del self.state['processed'][company_upper]
-            self._update_stats()
-            self._save_state()
+        cur = self.conn.execute('DELETE FROM processed WHERE company=?', (company_upper,))
+        if cur.rowcount:
+            self._flat_cache = None
+            self._commit()
             logger.info(f"Cleared state for company: {company_upper}")
-    
+
     def clear_all(self):
         """
         Clear all processing state.
         Used for forcing a full re-run.
         """
-        self.state = {
-            'processed': {},
-            'last_full_run': None,
-            'last_incremental_run': None,
-            'stats': {'total_processed': 0, 'total_companies': 0}
-        }
-        self._save_state()
+        self.conn.execute('DELETE FROM processed')
+        self.conn.execute('DELETE FROM runs')
+        self._flat_cache = None
+        self._commit()
         logger.info("Cleared all processing state")
-    
+
     def record_run(self, run_type: str = 'incremental', stats: Dict = None):
         """
         Record a processing run.
-        
+
         Args:
             run_type: 'full' or 'incremental'
             stats: Optional run statistics
         """
-        timestamp = datetime.now().isoformat()
-        
-        if run_type == 'full':
-            self.state['last_full_run'] = {
-                'timestamp': timestamp,
-                'stats': stats or {}
-            }
-        else:
-            self.state['last_incremental_run'] = {
-                'timestamp': timestamp,
-                'stats': stats or {}
-            }
-        
-        self._save_state()
-    
+        key = 'full' if run_type == 'full' else 'incremental'
+        self.conn.execute(
+            'INSERT OR REPLACE INTO runs VALUES(?,?,?)',
+            (key, datetime.now().isoformat(), _dump_meta(stats or {})))
+        self._commit()
+
+    def _get_run(self, run_type: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            'SELECT ts, stats FROM runs WHERE run_type=?', (run_type,)).fetchone()
+        if row is None:
+            return None
+        return {'timestamp': row[0], 'stats': json.loads(row[1] or '{}')}
+
+    def _stats(self) -> Dict:
+        total, companies = self.conn.execute(
+            'SELECT COUNT(*), COUNT(DISTINCT company) FROM processed').fetchone()
+        return {'total_processed': total, 'total_companies': companies}
+
     def get_run_history(self) -> Dict:
         """Get run history information."""
         return {
-            'last_full_run': self.state.get('last_full_run'),
-            'last_incremental_run': self.state.get('last_incremental_run'),
-            'stats': self.state.get('stats', {})
+            'last_full_run': self._get_run('full'),
+            'last_incremental_run': self._get_run('incremental'),
+            'stats': self._stats()
         }
-    
+
     def get_summary(self) -> Dict:
         """Get summary of processing state."""
-        processed = self.state.get('processed', {})
-        
-        # Calculate per-company stats
-        company_stats = []
-        for company, quarters in processed.items():
-            company_stats.append({
-                'company': company,
-                'quarters': len(quarters)
-            })
-        
-        # Sort by number of quarters
-        company_stats.sort(key=lambda x: x['quarters'], reverse=True)
-        
-        last_full = self.state.get('last_full_run')
-        last_incr = self.state.get('last_incremental_run')
-        
+        stats = self._stats()
+        top = self.conn.execute(
+            'SELECT company, COUNT(*) AS n FROM processed '
+            'GROUP BY company ORDER BY n DESC LIMIT 10').fetchall()
+        last_full = self._get_run('full')
+        last_incr = self._get_run('incremental')
+
         return {
-            'total_companies': len(processed),
-            'total_quarters': sum(len(q) for q in processed.values()),
-            'top_companies': company_stats[:10],
+            'total_companies': stats['total_companies'],
+            'total_quarters': stats['total_processed'],
+            'top_companies': [{'company': c, 'quarters': n} for c, n in top],
             'last_full_run': last_full.get('timestamp') if last_full else None,
             'last_incremental_run': last_incr.get('timestamp') if last_incr else None
         }
@@ -277,32 +310,32 @@ if __name__ == "__main__":
     # Test the state tracker
     print("Testing State Tracker...")
     print("=" * 50)
-    
+
     tracker = StateTracker()
-    
+
     # Test marking items as processed
     test_items = [
         ('RELIANCE', 'Jan_2024', {'sentiment': 0.5}),
         ('RELIANCE', 'Apr_2024', {'sentiment': 0.6}),
         ('TCS', 'Jan_2024', {'sentiment': 0.4}),
     ]
-    
+
     print(f"Before: {tracker.get_summary()}")
-    
+
     tracker.mark_batch_processed(test_items)
-    
+
     print(f"After: {tracker.get_summary()}")
-    
+
     # Test filtering
     available = [
         ('RELIANCE', 'Jan_2024'),
         ('RELIANCE', 'Jul_2024'),
         ('TCS', 'Apr_2024'),
     ]
-    
+
     unprocessed = tracker.get_unprocessed(available)
     print(f"Unprocessed: {unprocessed}")
-    
+
     # Clean up test data
     tracker.clear_all()
     print("State cleared for testing")
@@ -26,8 +26,13 @@ import io
 import re
 import json
 import time
+import hashlib
+import asyncio
 import logging
+import atexit
 import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from urllib.parse import urljoin, quote
@@ -37,6 +42,14 @@ import pandas as pd
 import numpy as np
 from bs4 import BeautifulSoup
 
+# lxml's C parser cuts page-parse time several-fold vs html.parser;
+# the tree API is identical so everything downstream is unchanged
+try:
+    import lxml  # noqa: F401
+    BS_PARSER = 'lxml'
+except ImportError:
+    BS_PARSER = 'html.parser'
+
 # HTTP client
 try:
     from curl_cffi import requests as cffi_requests
@@ -45,8 +58,19 @@ except ImportError:
     import requests as cffi_requests
     USE_CFFI = False
 
+# orjson encodes SSE events in C when available
+try:
+    import orjson
+
+    def _sse_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _sse_dumps(obj) -> str:
+        return json.dumps(obj)
+
 # Local modules
-from finbert_analyzer import FinBERTAnalyzer
+import state_tracker as state_tracker_module
+from finbert_analyzer import get_analyzer
 from company_manager import CompanyManager, get_company_manager
 from state_tracker import StateTracker, get_state_tracker
 
@@ -57,10 +81,49 @@ OUTPUT_FILE = BASE_PATH / "Sentiment_Analysis_Production.xlsx"
 # Detect serverless environment (Vercel)
 IS_SERVERLESS = os.environ.get('VERCEL', '') == '1'
 
+# Disk-backed HTTP cache: company pages change rarely, so repeated
+# incremental runs shouldn't re-pay network latency for the same HTML
+try:
+    from diskcache import Cache
+    _http_cache = Cache(str(BASE_PATH / '.http_cache'))
+    # FinBERT results keyed by transcript-text hash: repeat runs skip
+    # tokenization and inference entirely for unchanged transcripts
+    _sentiment_cache = Cache(str(BASE_PATH / '.sentiment_cache'))
+except ImportError:
+    _http_cache = None
+    _sentiment_cache = None
+
+PAGE_CACHE_TTL = 6 * 3600  # seconds
+
+# Precompiled patterns shared by the fetcher and the local processor;
+# compiling once avoids a cache probe per call in the indexing loops
+_MONTH_CTX_RE = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})$')
+_URL_DATE_RE = re.compile(r'(\d{4})[/-](\d{2})[/-](\d{2})')
+_YEAR_RE = re.compile(r'20(1[5-9]|2[0-6])')
+_DATE_RE = re.compile(r'(\d{4})[-_](\d{2})[-_](\d{2})')
+_Q_RE = re.compile(r'q([1-4])')
+_FY_RE = re.compile(r'fy[- ]?(\d{2,4})')
+
+# Single-pass month detection: one scan over the filename instead of
+# up to 24 substring searches (full names listed first)
+_MONTHS_RE = re.compile(
+    r'(january|february|march|april|may|june|july|august|september|october'
+    r'|november|december|jan|feb|mar|apr|jun|jul|aug|sep|oct|nov|dec)')
+
+# Headings that end the concalls section during the link walk; one regex
+# scan per heading instead of five substring checks
+_STOP_RE = re.compile(r'announcements|annual reports|shareholding|quarters|credit ratings')
+
+_MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Global processing state
+# Global processing state. For in-process reads this is a plain dict;
+# when an analysis run is spawned it is swapped for a Manager().dict()
+# proxy shared with the child process, so FinBERT/PyMuPDF work runs
+# outside the GIL of the Flask process while status stays visible.
 processing_status = {
     'running': False,
     'progress': 0,
@@ -71,6 +134,76 @@ processing_status = {
     'logs': []
 }
 
+_mp_manager = None
+
+
+def _log_status(message):
+    """Append to the status log; Manager proxies hand back copies of
+    mutable values, so the list must be reassigned, not mutated."""
+    logs = processing_status['logs']
+    logs.append(message)
+    processing_status['logs'] = logs
+
+
+def _get_status_proxy():
+    """Swap processing_status for a shared Manager dict (first use only)."""
+    global _mp_manager, processing_status
+    if _mp_manager is None:
+        _mp_manager = mp.Manager()
+        processing_status = _mp_manager.dict(processing_status)
+    return processing_status
+
+
+def _pipeline_worker(status, mode, kwargs):
+    """Child-process entry point for the heavy analysis pipeline."""
+    global processing_status
+    processing_status = status
+    # Under fork the child inherits the Flask parent's StateTracker and
+    # with it the parent's open sqlite3 connection; sharing one SQLite
+    # fd across processes is documented as unsafe (shared POSIX lock
+    # state, possible corruption). Drop the singleton so AnalysisEngine
+    # opens a fresh connection in this process.
+    state_tracker_module._tracker_instance = None
+    try:
+        engine = AnalysisEngine()
+        if mode == 'full':
+            result = engine.run_full(**kwargs)
+        elif mode == 'local':
+            result = engine.run_local_analysis(**kwargs)
+        else:
+            result = engine.run_incremental(**kwargs)
+        status['result'] = result
+    except Exception as e:
+        logger.error(f"Pipeline worker failed: {e}")
+        status['result'] = {'success': False, 'error': str(e)}
+        status['running'] = False
+
+
+class _TokenBucket:
+    """Minimal async token bucket: at most ``rate`` acquisitions/second.
+
+    Only outbound HTTP requests pass through it, so cache hits, parsing
+    and inference never wait on the politeness budget.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            now = asyncio.get_event_loop().time()
+            wait = self._next - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now += wait
+            self._next = max(self._next, now) + self.interval
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
 
 # ==============================================================================
 # CLOUD TRANSCRIPT FETCHER
@@ -80,7 +213,13 @@ class CloudTranscriptFetcher:
     Fetches transcripts directly from screener.in without saving to disk.
     Returns text content for analysis.
     """
-    
+
+    # Selector constants built once at class level; the parse fallback
+    # chain reuses them for every symbol instead of rebuilding per page
+    _SECTION_TAGS = ['h2', 'h3', 'h4', 'div', 'section']
+    _DOC_TAGS = ['h2', 'h3']
+    _HEADING_TAGS = ('h2', 'h3', 'h4')
+
     def __init__(self):
         self.base_url = "https://www.screener.in"
         self.impersonate_ver = "chrome120"
@@ -88,68 +227,283 @@ class CloudTranscriptFetcher:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         }
-    
-    def _fetch(self, url: str, timeout: int = 30) -> str:
-        """Fetch HTML content from URL."""
+        # One pooled session for all sync fetches: keep-alive skips the
+        # TCP+TLS handshake on every request after the first
+        self.session = cffi_requests.Session()
+        self.session.headers.update(self.headers)
+        atexit.register(self.session.close)
+    
+    @staticmethod
+    def _cache_get(url: str):
+        """Return the cached entry dict for a URL, or None.
+
+        Entries carry the body plus ETag/Last-Modified validators and a
+        fetch timestamp; legacy plain-string values are wrapped so older
+        caches keep working.
+        """
+        if _http_cache is None:
+            return None
+        try:
+            entry = _http_cache.get(url)
+        except Exception:
+            return None
+        if isinstance(entry, str):
+            entry = {'body': entry, 'etag': None, 'last_modified': None, 'fetched_at': 0.0}
+        return entry
+
+    @staticmethod
+    def _cache_put(url: str, body: str, etag: str = None, last_modified: str = None):
+        if _http_cache is None or not body:
+            return
+        try:
+            # No expire: stale entries are revalidated with a conditional
+            # GET instead of being refetched in full
+            _http_cache.set(url, {
+                'body': body,
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched_at': time.time(),
+            })
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_fresh(entry) -> bool:
+        return entry is not None and time.time() - entry.get('fetched_at', 0) < PAGE_CACHE_TTL
+
+    @staticmethod
+    def _conditional_headers(entry) -> dict:
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _fetch(self, url: str, timeout: int = 30, bypass_cache: bool = False) -> str:
+        """Fetch HTML content from URL (disk-cached with a TTL).
+
+        Fresh entries are served straight from disk; stale ones are
+        revalidated with If-None-Match/If-Modified-Since so an unchanged
+        listing costs a 304 with no body instead of a full transfer.
+        """
+        cached = self._cache_get(url)
+        if not bypass_cache and self._is_fresh(cached):
+            return cached['body']
         try:
+            headers = self._conditional_headers(cached)
             if USE_CFFI:
-                response = cffi_requests.get(
-                    url, 
-                    headers=self.headers,
+                response = self.session.get(
+                    url,
+                    headers=headers,
                     impersonate=self.impersonate_ver,
                     timeout=timeout
                 )
             else:
-                response = cffi_requests.get(url, headers=self.headers, timeout=timeout)
-            
-            return response.text if response.status_code == 200 else ""
+                response = self.session.get(url, headers=headers, timeout=timeout)
+
+            if response.status_code == 304 and cached:
+                self._cache_put(url, cached['body'], cached.get('etag'),
+                                cached.get('last_modified'))
+                return cached['body']
+
+            body = response.text if response.status_code == 200 else ""
+            self._cache_put(url, body, response.headers.get('ETag'),
+                            response.headers.get('Last-Modified'))
+            return body
         except Exception as e:
             logger.error(f"Error fetching {url}: {e}")
             return ""
-    
-    def get_company_page(self, symbol: str) -> str:
+
+    def fetch_pdf_bytes(self, url: str, timeout: int = 60,
+                        max_bytes: int = 50 * 1024 * 1024) -> bytes:
+        """Stream a PDF download in 64KB chunks with a hard size cap.
+
+        Keeps memory bounded on multi-MB filings instead of buffering
+        whole responses; returns b'' on error or when the cap is hit.
+        """
+        try:
+            if USE_CFFI:
+                response = self.session.get(
+                    url,
+                    impersonate=self.impersonate_ver,
+                    timeout=timeout,
+                    allow_redirects=True,
+                    stream=True
+                )
+            else:
+                response = self.session.get(
+                    url, timeout=timeout, allow_redirects=True, stream=True)
+
+            if response.status_code != 200:
+                logger.warning(f"Failed to fetch {url}: HTTP {response.status_code}")
+                return b""
+
+            buf = io.BytesIO()
+            for chunk in response.iter_content(65536):
+                buf.write(chunk)
+                if buf.tell() > max_bytes:
+                    logger.warning(f"Aborting {url}: exceeds {max_bytes} bytes")
+                    return b""
+            return buf.getvalue()
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return b""
+
+    def get_company_page(self, symbol: str, bypass_cache: bool = False) -> str:
         """Get company page HTML."""
         url = f"{self.base_url}/company/{quote(symbol)}/consolidated/"
-        return self._fetch(url)
-    
-    def _extract_date_from_context(self, link_element) -> dict:
-        """Extract date from surrounding context."""
-        previous = link_element.find_previous()
-        attempts = 0
-        
-        while previous and attempts < 10:
-            text = previous.get_text(strip=True) if hasattr(previous, 'get_text') else str(previous)
-            match = re.match(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{4})$', text)
-            if match:
-                return {'month': match.group(1), 'year': match.group(2)}
-            previous = previous.find_previous()
-            attempts += 1
-        return None
+        return self._fetch(url, bypass_cache=bypass_cache)
     
     def _extract_date_from_url(self, url: str) -> dict:
         """Extract date from URL pattern."""
-        match = re.search(r'(\d{4})[/-](\d{2})[/-](\d{2})', url)
+        match = _URL_DATE_RE.search(url)
         if match:
             year = match.group(1)
             month_num = int(match.group(2))
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            month = months[month_num - 1] if 1 <= month_num <= 12 else 'Unknown'
+            month = _MONTH_ABBR[month_num - 1] if 1 <= month_num <= 12 else 'Unknown'
             return {'month': month, 'year': year}
         return None
     
-    def get_transcript_urls(self, symbol: str, start_year: int = 2015, end_year: int = 2026) -> list:
+    async def _fetch_async(self, session, semaphore, url: str, timeout: int = 30,
+                           bypass_cache: bool = False, limiter: _TokenBucket = None) -> str:
+        """Async twin of _fetch, bounded by the shared semaphore."""
+        cached = self._cache_get(url)
+        if not bypass_cache and self._is_fresh(cached):
+            return cached['body']
+        async with semaphore:
+            try:
+                if limiter is not None:
+                    async with limiter:
+                        response = await session.get(
+                            url, headers=self._conditional_headers(cached), timeout=timeout)
+                else:
+                    response = await session.get(
+                        url, headers=self._conditional_headers(cached), timeout=timeout)
+
+                if response.status_code == 304 and cached:
+                    self._cache_put(url, cached['body'], cached.get('etag'),
+                                    cached.get('last_modified'))
+                    return cached['body']
+
+                body = response.text if response.status_code == 200 else ""
+                self._cache_put(url, body, response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'))
+                return body
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return ""
+
+    async def _get_transcripts_async(self, session, semaphore, symbol: str,
+                                     start_year: int, end_year: int,
+                                     bypass_cache: bool = False,
+                                     limiter: _TokenBucket = None) -> list:
+        url = f"{self.base_url}/company/{quote(symbol)}/consolidated/"
+        html = await self._fetch_async(session, semaphore, url, bypass_cache=bypass_cache,
+                                       limiter=limiter)
+        if not html:
+            return []
+        return self._parse_transcripts(html, symbol, start_year, end_year)
+
+    def get_transcript_urls_bulk(self, symbols: list, start_year: int = 2015,
+                                 end_year: int = 2026, concurrency: int = 20,
+                                 bypass_cache: bool = False) -> dict:
+        """
+        Fetch transcript URL lists for many companies concurrently.
+
+        Page fetches are I/O-bound, so overlapping them saves wall-clock
+        roughly proportional to the concurrency limit. Falls back to a
+        sequential loop when curl_cffi's AsyncSession isn't available.
+
+        Returns:
+            Dict mapping symbol -> list of transcript dicts
+        """
+        if not USE_CFFI:
+            return {s: self.get_transcript_urls(s, start_year, end_year, bypass_cache=bypass_cache)
+                    for s in symbols}
+
+        async def runner():
+            semaphore = asyncio.Semaphore(concurrency)
+            limiter = _TokenBucket(rate=3.0)
+            async with cffi_requests.AsyncSession(
+                    impersonate=self.impersonate_ver, headers=self.headers) as session:
+                results = await asyncio.gather(*[
+                    self._get_transcripts_async(session, semaphore, s, start_year, end_year,
+                                                bypass_cache=bypass_cache, limiter=limiter)
+                    for s in symbols
+                ])
+            return dict(zip(symbols, results))
+
+        return asyncio.run(runner())
+
+    async def _fetch_pdf_async(self, session, semaphore, url: str, timeout: int = 60,
+                               max_bytes: int = 50 * 1024 * 1024,
+                               limiter: _TokenBucket = None) -> bytes:
+        """Async twin of fetch_pdf_bytes, bounded by the shared semaphore."""
+        async with semaphore:
+            try:
+                if limiter is not None:
+                    async with limiter:
+                        response = await session.get(url, timeout=timeout, allow_redirects=True)
+                else:
+                    response = await session.get(url, timeout=timeout, allow_redirects=True)
+                if response.status_code != 200:
+                    logger.warning(f"Failed to fetch {url}: HTTP {response.status_code}")
+                    return b""
+                body = response.content
+                if len(body) > max_bytes:
+                    logger.warning(f"Aborting {url}: exceeds {max_bytes} bytes")
+                    return b""
+                return body
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return b""
+
+    def fetch_pdf_bytes_bulk(self, urls: list, concurrency: int = 5) -> dict:
+        """
+        Download many transcript PDFs concurrently.
+
+        The semaphore doubles as the politeness limit: at most
+        `concurrency` requests are in flight against the host at once,
+        replacing fixed inter-download sleeps. Falls back to sequential
+        downloads when curl_cffi's AsyncSession isn't available.
+
+        Returns:
+            Dict mapping url -> PDF bytes (b'' on failure)
+        """
+        if not USE_CFFI:
+            return {u: self.fetch_pdf_bytes(u) for u in urls}
+
+        async def runner():
+            semaphore = asyncio.Semaphore(concurrency)
+            limiter = _TokenBucket(rate=3.0)
+            async with cffi_requests.AsyncSession(
+                    impersonate=self.impersonate_ver, headers=self.headers) as session:
+                bodies = await asyncio.gather(*[
+                    self._fetch_pdf_async(session, semaphore, u, limiter=limiter)
+                    for u in urls
+                ])
+            return dict(zip(urls, bodies))
+
+        return asyncio.run(runner())
+
+    def get_transcript_urls(self, symbol: str, start_year: int = 2015, end_year: int = 2026,
+                            bypass_cache: bool = False) -> list:
         """
         Get list of transcript URLs for a company.
-        
+
         Returns:
             List of dicts with 'url', 'month', 'year' keys
         """
-        html = self.get_company_page(symbol)
+        html = self.get_company_page(symbol, bypass_cache=bypass_cache)
         if not html:
             return []
-        
-        soup = BeautifulSoup(html, 'html.parser')
+        return self._parse_transcripts(html, symbol, start_year, end_year)
+
+    def _parse_transcripts(self, html: str, symbol: str, start_year: int, end_year: int) -> list:
+        """Extract transcript links from company-page HTML."""
+        soup = BeautifulSoup(html, BS_PARSER)
         transcripts = []
         
         try:
@@ -158,7 +512,7 @@ class CloudTranscriptFetcher:
             
             # Method 2: Find heading with 'concalls' text (case-insensitive)
             if not concalls_section:
-                for heading in soup.find_all(['h2', 'h3', 'h4', 'div', 'section']):
+                for heading in soup.find_all(self._SECTION_TAGS):
                     heading_text = heading.get_text(strip=True).lower()
                     if 'concalls' in heading_text or 'con calls' in heading_text:
                         concalls_section = heading
@@ -166,7 +520,7 @@ class CloudTranscriptFetcher:
             
             # Method 3: Search within Documents section
             if not concalls_section:
-                for heading in soup.find_all(['h2', 'h3']):
+                for heading in soup.find_all(self._DOC_TAGS):
                     if 'documents' in heading.get_text(strip=True).lower():
                         # Look for Concalls within this section
                         sibling = heading.find_next()
@@ -186,35 +540,45 @@ class CloudTranscriptFetcher:
             
             # Collect all links from the concalls section
             all_links = []
-            current = concalls_section.find_next() if concalls_section.name in ['h2', 'h3', 'h4'] else concalls_section
-            stop_keywords = ['announcements', 'annual reports', 'shareholding', 'quarters', 'credit ratings']
-            
-            while current and len(all_links) < 300:
-                if current.name in ['h2', 'h3', 'h4']:
+            current = concalls_section.find_next() if concalls_section.name in self._HEADING_TAGS else concalls_section
+
+            # Single linear walk: find_next already visits descendants, so
+            # collecting <a> tags directly avoids re-scanning each subtree
+            # with find_all (which made the traversal quadratic). Date
+            # labels ("Jan 2024") are picked up in the same pass and
+            # attached to the links that follow them, so no per-link
+            # backwards traversal is needed later.
+            last_date = None
+            while current and len(all_links) < 100:
+                if current.name in self._HEADING_TAGS:
                     text = current.get_text(strip=True).lower()
-                    if any(k in text for k in stop_keywords):
+                    if _STOP_RE.search(text):
                         break
-                
+
                 if current.name == 'a':
-                    all_links.append(current)
-                elif hasattr(current, 'find_all'):
-                    all_links.extend(current.find_all('a', href=True))
-                
+                    all_links.append((current, last_date))
+                else:
+                    label = current.string
+                    if label:
+                        match = _MONTH_CTX_RE.match(label.strip())
+                        if match:
+                            last_date = {'month': match.group(1), 'year': match.group(2)}
+
                 current = current.find_next()
             
             # Filter transcript links
             seen_urls = set()
-            for link in all_links:
+            for link, context_date in all_links:
                 href = link.get('href', '')
                 text = link.get_text(strip=True).lower()
-                
+
                 if not href or href.startswith('#') or 'javascript:' in href:
                     continue
                 if 'transcript' not in text:
                     continue
-                
+
                 # Get date
-                date_info = self._extract_date_from_context(link) or self._extract_date_from_url(href)
+                date_info = context_date or self._extract_date_from_url(href)
                 if not date_info:
                     continue
                 
@@ -264,44 +628,35 @@ class LocalTranscriptProcessor:
             self.pdf_folder = BASE_PATH.parent / "Screener_Documents"
         else:
             self.pdf_folder = Path(pdf_folder)
-    
+
+        # Directory-scan memos, invalidated by folder mtime (see
+        # _folder_mtime); saves thousands of stat calls per request
+        self._scan_cache = {}
+        self._companies_cache = (None, [])
+
     def _extract_date_from_filename(self, filename: str) -> dict:
         """Extract month and year from filename patterns."""
-        import re
-        
         # Common patterns in transcript filenames
         # Pattern: "Company_Q1_FY24_transcript.pdf" or similar
         # Pattern: "2024-01-15_transcript.pdf"
         # Pattern: "Jan_2024_concall.pdf"
         
-        months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 
+        months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
                   'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
-        month_map = {m: m.capitalize()[:3] for m in months}
-        full_months = ['january', 'february', 'march', 'april', 'may', 'june',
-                       'july', 'august', 'september', 'october', 'november', 'december']
-        full_month_map = {m: months[i][:3].capitalize() for i, m in enumerate(full_months)}
-        
+
         fn = filename.lower()
-        
-        # Try to find month name
-        found_month = None
-        for full_m in full_months:
-            if full_m in fn:
-                found_month = full_month_map[full_m]
-                break
-        if not found_month:
-            for m in months:
-                if m in fn:
-                    found_month = month_map[m]
-                    break
+
+        # Try to find month name (one pass over the filename)
+        month_match = _MONTHS_RE.search(fn)
+        found_month = month_match.group(1)[:3].capitalize() if month_match else None
         
         # Try to find year (4 digit number 2015-2026)
-        year_match = re.search(r'20(1[5-9]|2[0-6])', fn)
+        year_match = _YEAR_RE.search(fn)
         found_year = year_match.group(0) if year_match else None
-        
+
         # If no month found, try date pattern YYYY-MM-DD or DD-MM-YYYY
         if not found_month and found_year:
-            date_match = re.search(r'(\d{4})[-_](\d{2})[-_](\d{2})', fn)
+            date_match = _DATE_RE.search(fn)
             if date_match:
                 month_num = int(date_match.group(2))
                 if 1 <= month_num <= 12:
@@ -309,8 +664,8 @@ class LocalTranscriptProcessor:
         
         # Quarter-based patterns
         if not found_month:
-            q_match = re.search(r'q([1-4])', fn)
-            fy_match = re.search(r'fy[- ]?(\d{2,4})', fn)
+            q_match = _Q_RE.search(fn)
+            fy_match = _FY_RE.search(fn)
             if q_match:
                 quarter = int(q_match.group(1))
                 # FY Q1=Apr-Jun, Q2=Jul-Sep, Q3=Oct-Dec, Q4=Jan-Mar
@@ -330,67 +685,108 @@ class LocalTranscriptProcessor:
             List of dicts with 'path', 'month', 'year' keys
         """
         company_folder = self.pdf_folder / company
-        if not company_folder.exists():
-            return []
-        
+
+        # Memoize per (company, year range); the folder mtime in the key
+        # invalidates the entry when files are added or removed
+        cache_key = (company, start_year, end_year, self._folder_mtime(company_folder))
+        cached = self._scan_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         transcripts = []
-        
-        for year_folder in sorted(company_folder.iterdir()):
-            if not year_folder.is_dir():
+
+        # os.scandir hands back DirEntry objects with cached stat/is_dir,
+        # so enumerating big trees costs one syscall per directory instead
+        # of one per pathlib call; Path objects only at the boundary
+        try:
+            year_entries = sorted(os.scandir(company_folder), key=lambda e: e.name)
+        except OSError:
+            return []
+
+        for year_entry in year_entries:
+            if not year_entry.is_dir():
                 continue
-            
-            try:
-                year = int(year_folder.name)
-                if year < start_year or year > end_year:
-                    continue
-            except ValueError:
+
+            # Cheap check first: non-year folders are common, and raising
+            # ValueError from int() costs far more than isdigit()
+            name = year_entry.name
+            if not (len(name) == 4 and name.isdigit()):
                 continue
-            
-            transcript_folder = year_folder / 'Transcript'
-            if not transcript_folder.exists():
+            year = int(name)
+            if year < start_year or year > end_year:
                 continue
-            
-            for pdf_file in sorted(transcript_folder.glob('*.pdf')):
-                date_info = self._extract_date_from_filename(pdf_file.name)
-                
+
+            transcript_folder = os.path.join(year_entry.path, 'Transcript')
+            try:
+                pdf_entries = sorted(
+                    (e for e in os.scandir(transcript_folder) if e.name.endswith('.pdf')),
+                    key=lambda e: e.name)
+            except OSError:
+                continue
+
+            for pdf_entry in pdf_entries:
+                date_info = self._extract_date_from_filename(pdf_entry.name)
+
                 # Override year from folder if not found in filename
                 if date_info['year'] == 'Unknown':
                     date_info['year'] = str(year)
-                
+
                 transcripts.append({
-                    'path': pdf_file,
+                    'path': Path(pdf_entry.path),
                     'month': date_info['month'],
                     'year': date_info['year'],
                     'quarter': f"{date_info['month']} {date_info['year']}"
                 })
-        
+
+        self._scan_cache[cache_key] = transcripts
         return transcripts
     
+    @staticmethod
+    def _folder_mtime(path) -> int:
+        """mtime_ns of a folder, or -1 when it does not exist."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return -1
+
     def get_all_companies(self) -> list:
         """Get list of all company folders in the PDF directory."""
-        if not self.pdf_folder.exists():
+        cache_key = self._folder_mtime(self.pdf_folder)
+        if cache_key == -1:
             return []
-        
-        return [d.name for d in self.pdf_folder.iterdir() if d.is_dir()]
+        if cache_key == self._companies_cache[0]:
+            return self._companies_cache[1]
+
+        # is_dir() can hit the filesystem per entry on network mounts;
+        # fan the checks out across threads (syscalls release the GIL)
+        with os.scandir(self.pdf_folder) as it:
+            entries = list(it)
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            companies = [e.name for e, is_dir in
+                         zip(entries, ex.map(os.DirEntry.is_dir, entries)) if is_dir]
+        self._companies_cache = (cache_key, companies)
+        return companies
     
     def extract_text_from_pdf(self, pdf_path: Path) -> str:
         """Extract text from a local PDF file."""
         try:
             import fitz  # PyMuPDF
             doc = fitz.open(pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
+            try:
+                # Load pages one at a time so each page buffer can be
+                # freed before the next loads; join avoids quadratic
+                # str concat on long transcripts
+                text = "".join(doc.load_page(i).get_text("text")
+                               for i in range(doc.page_count))
+            finally:
+                doc.close()
             return text.strip()
         except ImportError:
             # Fallback to pdfplumber
             try:
                 import pdfplumber
-                text = ""
                 with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        text += page.extract_text() or ""
+                    text = "".join(page.extract_text() or "" for page in pdf.pages)
                 return text.strip()
             except ImportError:
                 logger.error("Neither PyMuPDF nor pdfplumber installed. Run: pip install pymupdf pdfplumber")
@@ -399,6 +795,51 @@ class LocalTranscriptProcessor:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
             return ""
 
+    def extract_text_from_bytes(self, data: bytes) -> str:
+        """Extract text from an in-memory PDF (e.g. an upload) without
+        touching disk."""
+        try:
+            import fitz  # PyMuPDF
+            doc = fitz.open(stream=data, filetype='pdf')
+            try:
+                text = "".join(doc.load_page(i).get_text("text")
+                               for i in range(doc.page_count))
+            finally:
+                doc.close()
+            return text.strip()
+        except ImportError:
+            # Fallback to pdfplumber
+            try:
+                import pdfplumber
+                with pdfplumber.open(io.BytesIO(data)) as pdf:
+                    text = "".join(page.extract_text() or "" for page in pdf.pages)
+                return text.strip()
+            except ImportError:
+                logger.error("Neither PyMuPDF nor pdfplumber installed. Run: pip install pymupdf pdfplumber")
+                return ""
+        except Exception as e:
+            logger.error(f"Error extracting text from uploaded PDF: {e}")
+            return ""
+
+
+def _extract_one(path_str: str) -> str:
+    """Extract PDF text in a worker process (PyMuPDF only, picklable).
+
+    pdfplumber fallback is deliberately skipped here; the main process
+    handles it for the rare file PyMuPDF can't read.
+    """
+    try:
+        import fitz
+        doc = fitz.open(path_str)
+        try:
+            text = "".join(doc.load_page(i).get_text()
+                           for i in range(doc.page_count))
+        finally:
+            doc.close()
+        return text.strip()
+    except Exception:
+        return ""
+
 
 # ==============================================================================
 # ANALYSIS ENGINE
@@ -410,57 +851,148 @@ class AnalysisEngine:
     
     def __init__(self):
         self.fetcher = CloudTranscriptFetcher()
-        self.analyzer = FinBERTAnalyzer()
+        self.analyzer = get_analyzer()
         self.company_mgr = get_company_manager()
         self.state_tracker = get_state_tracker()
         self.output_file = OUTPUT_FILE
-    
+        # In-memory copy of the output sheet so per-batch saves don't
+        # re-parse the workbook from disk every 10 companies, plus its
+        # (Company, Year, Month) key set for O(new) duplicate checks
+        self._existing_df = None
+        self._existing_keys = None
+    
+    def _analyze_cached(self, text: str) -> dict:
+        """Run analyze_transcript through the persistent content-hash cache."""
+        if _sentiment_cache is None:
+            return self.analyzer.analyze_transcript(text)
+        key = hashlib.sha1(text.encode('utf-8', 'ignore')).hexdigest()
+        try:
+            hit = _sentiment_cache.get(key)
+        except Exception:
+            hit = None
+        if hit is not None:
+            return hit
+        result = self.analyzer.analyze_transcript(text)
+        try:
+            _sentiment_cache.set(key, result)
+        except Exception:
+            pass
+        return result
+
+    def _analyze_many(self, texts: list) -> list:
+        """Analyze a list of transcripts, batching inference for cache misses.
+
+        Misses are deduplicated by content hash before inference, so two
+        companies sharing an identical filing pay for one forward pass.
+        """
+        results = [None] * len(texts)
+        keys = [hashlib.sha1(t.encode('utf-8', 'ignore')).hexdigest() for t in texts]
+        unique_misses = {}  # key -> list of positions sharing that text
+        for i, key in enumerate(keys):
+            if _sentiment_cache is not None:
+                try:
+                    hit = _sentiment_cache.get(key)
+                except Exception:
+                    hit = None
+                if hit is not None:
+                    results[i] = hit
+                    continue
+            unique_misses.setdefault(key, []).append(i)
+
+        if unique_misses:
+            owners = list(unique_misses.values())
+            analyses = self.analyzer.analyze_batch([texts[positions[0]] for positions in owners])
+            for positions, analysis in zip(owners, analyses):
+                for i in positions:
+                    results[i] = analysis
+                if _sentiment_cache is not None:
+                    try:
+                        _sentiment_cache.set(keys[positions[0]], analysis)
+                    except Exception:
+                        pass
+        return results
+
     def _load_existing_data(self) -> pd.DataFrame:
-        """Load existing analysis data."""
-        if self.output_file.exists():
+        """Load existing analysis data (cached after the first read)."""
+        if self._existing_df is not None:
+            return self._existing_df
+
+        df = pd.DataFrame()
+        parquet = self.output_file.with_suffix('.parquet')
+        # Only trust the sidecar while it's at least as new as the
+        # workbook — an externally replaced xlsx must win
+        try:
+            use_parquet = parquet.stat().st_mtime >= self.output_file.stat().st_mtime
+        except OSError:
+            use_parquet = parquet.exists()
+        if use_parquet:
             try:
-                return pd.read_excel(self.output_file, sheet_name='Quarterly Sentiment')
+                df = pd.read_parquet(parquet)
+            except Exception:
+                pass
+        if df.empty and self.output_file.exists():
+            try:
+                df = pd.read_excel(self.output_file, sheet_name='Quarterly Sentiment')
             except:
                 pass
-        return pd.DataFrame()
+        self._existing_df = df
+        return df
     
-    def analyze_company(self, nse_code: str, force: bool = False) -> list:
+    def analyze_company(self, nse_code: str, force: bool = False, transcripts: list = None) -> list:
         """
         Analyze a single company.
-        
+
         Args:
             nse_code: NSE trading symbol
             force: If True, re-analyze even if already processed
-            
+            transcripts: Pre-fetched transcript list (from
+                get_transcript_urls_bulk); fetched here when None
+
         Returns:
             List of result dicts for each quarter
         """
         results = []
         company_info = self.company_mgr.get_company(nse_code)
         sector = company_info['industry'] if company_info else 'Unknown'
-        
-        # Get transcript URLs
-        transcripts = self.fetcher.get_transcript_urls(nse_code)
+
+        # Get transcript URLs (force bypasses the disk HTTP cache)
+        if transcripts is None:
+            transcripts = self.fetcher.get_transcript_urls(nse_code, bypass_cache=force)
         
         if not transcripts:
             logger.info(f"No transcripts found for {nse_code}")
             return []
         
-        for transcript in transcripts:
-            quarter = transcript['quarter']
-            
-            # Skip if already processed (unless force)
-            if not force and self.state_tracker.is_processed(nse_code, quarter):
-                logger.debug(f"Skipping {nse_code} {quarter} (already processed)")
-                continue
-            
-            # Fetch and analyze
-            text = self.analyzer.extract_pdf_from_url(transcript['url'])
+        # Phase 1: fetch texts for unprocessed quarters (network-bound).
+        # Downloads overlap behind a bounded semaphore, which also serves
+        # as the politeness limit against the host. Processed quarters
+        # are bulk-loaded once instead of queried per transcript.
+        processed = frozenset() if force else self.state_tracker.get_processed_set(nse_code)
+        wanted = [t for t in transcripts if t['quarter'] not in processed]
+        if not wanted:
+            return []
+
+        pdf_map = self.fetcher.fetch_pdf_bytes_bulk([t['url'] for t in wanted])
+
+        pending = []
+        texts = []
+        for transcript in wanted:
+            pdf_bytes = pdf_map.get(transcript['url'])
+            text = self.analyzer._extract_pdf_text(pdf_bytes, source=transcript['url']) if pdf_bytes else None
             if not text or len(text.split()) < 100:
                 continue
-            
-            analysis = self.analyzer.analyze_transcript(text)
-            
+
+            pending.append(transcript)
+            texts.append(text)
+
+        if not pending:
+            return []
+
+        # Phase 2: one batched inference pass over all new transcripts
+        analyses = self._analyze_many(texts)
+
+        marks = []
+        for transcript, analysis in zip(pending, analyses):
             result = {
                 'Company': nse_code,
                 'Sector': sector,
@@ -477,76 +1009,143 @@ class AnalysisEngine:
                 'File_Count': 1,
                 'Analyzed_At': datetime.now().isoformat()
             }
-            
+
             results.append(result)
-            
-            # Mark as processed
-            self.state_tracker.mark_processed(nse_code, quarter, {
-                'sentiment': analysis['overall_sentiment']
-            })
-            
-            # Small delay to be nice to screener.in
-            time.sleep(0.3)
-        
+            marks.append((nse_code, transcript['quarter'],
+                          {'sentiment': analysis['overall_sentiment']}))
+
+        # One executemany + one commit for the whole company
+        self.state_tracker.mark_batch_processed(marks)
+
         return results
     
-    def save_results(self, new_results: list, mode: str = 'append'):
+    def save_results(self, new_results: list, mode: str = 'append', final: bool = True):
         """
-        Save analysis results to Excel.
-        
+        Save analysis results.
+
         Args:
             new_results: List of result dicts
             mode: 'append' or 'replace'
+            final: When False (mid-run batch saves) only the Parquet
+                sidecar is written; the Excel workbook is materialized
+                once at the end of the run
         """
         if not new_results:
+            # Final call after batch flushes may carry an empty tail; the
+            # cached frame is current but still unsorted from the
+            # final=False saves, so give it the same cast + sort the
+            # non-empty final path applies before materializing
+            if final and self._existing_df is not None and not self._existing_df.empty:
+                sorted_df = self._sort_final(self._existing_df)
+                self._existing_df = sorted_df
+                self._write_sidecar(sorted_df)
+                self._write_excel(sorted_df)
             return
-        
+
         new_df = pd.DataFrame(new_results)
-        
+
+        # Consolidate to columnar float32 here, the one point every
+        # result passes through: score columns arrive as boxed Python
+        # floats from the per-row dicts, and single precision is plenty
+        # for sentiment scores (matches what the dashboards load)
+        for col in ('Overall_Sentiment', 'Polarity', 'Keyword_Sentiment', 'Guidance',
+                    'Risk', 'FinBERT_Positive', 'FinBERT_Negative', 'FinBERT_Neutral'):
+            if col in new_df.columns:
+                new_df[col] = new_df[col].astype(np.float32)
+
+        # Categorize only the new slice (O(new rows)); existing rows
+        # already carry their category from the save that produced them
+        sentiment = new_df['Overall_Sentiment']
+        new_df['Sentiment_Category'] = np.select(
+            [sentiment > 0.2, sentiment < -0.1], ['Positive', 'Negative'], 'Neutral')
+
+        new_keys = {(r['Company'], r['Year'], r['Month']) for r in new_results}
+
         if mode == 'append':
             existing_df = self._load_existing_data()
             if not existing_df.empty:
-                # Remove duplicates (keep new)
-                existing_df = existing_df[~existing_df.apply(
-                    lambda row: (row['Company'], row['Year'], row['Month']) in 
-                    [(r['Company'], r['Year'], r['Month']) for r in new_results],
-                    axis=1
-                )]
+                # Remove duplicates (keep new). The maintained key set
+                # makes the no-overlap common case O(new rows); only an
+                # actual collision pays for the index build and mask.
+                if self._existing_keys is None:
+                    self._existing_keys = set(zip(
+                        existing_df['Company'], existing_df['Year'], existing_df['Month']))
+                overlap = new_keys & self._existing_keys
+                if overlap:
+                    existing_keys = pd.MultiIndex.from_arrays(
+                        [existing_df['Company'], existing_df['Year'], existing_df['Month']])
+                    existing_df = existing_df.loc[~existing_keys.isin(overlap)]
                 final_df = pd.concat([existing_df, new_df], ignore_index=True)
             else:
                 final_df = new_df
         else:
             final_df = new_df
-        
-        # Add sentiment category
-        final_df['Sentiment_Category'] = final_df['Overall_Sentiment'].apply(
-            lambda x: 'Positive' if x > 0.2 else ('Negative' if x < -0.1 else 'Neutral')
-        )
-        
-        # Sort by company and date
-        month_map = {'Jan':1, 'Feb':2, 'Mar':3, 'Apr':4, 'May':5, 'Jun':6,
-                     'Jul':7, 'Aug':8, 'Sep':9, 'Oct':10, 'Nov':11, 'Dec':12}
-        final_df['Month_Num'] = final_df['Month'].map(month_map)
-        final_df = final_df.sort_values(
-            ['Company', 'Year', 'Month_Num'], 
+
+        # Sort by company and date; the ordered categorical sorts Month
+        # chronologically without materializing a helper column. Batch
+        # saves skip the sort — only the final workbook needs order.
+        if final:
+            final_df = self._sort_final(final_df)
+
+        # Keep the in-memory copy current so the next batch save merges
+        # against it instead of re-reading the workbook
+        self._existing_df = final_df
+        if mode == 'append' and self._existing_keys is not None:
+            self._existing_keys |= new_keys
+        else:
+            self._existing_keys = set(new_keys)
+
+        # Parquet sidecar is cheap to write and is what intermediate
+        # batch saves persist; the workbook itself only gets rewritten
+        # on the final save (xlsxwriter skips openpyxl's per-cell style
+        # machinery on value-only dumps)
+        self._write_sidecar(final_df)
+
+        if final:
+            self._write_excel(final_df)
+
+        logger.info(f"Saved {len(new_results)} new results to {self.output_file}")
+
+    @staticmethod
+    def _sort_final(df: pd.DataFrame) -> pd.DataFrame:
+        """Cast the key columns to categoricals and sort chronologically.
+
+        The casts turn the string sorts into integer-code sorts and
+        dictionary-encode both columns in the sidecar.
+        """
+        df['Company'] = df['Company'].astype('category')
+        df['Month'] = pd.Categorical(
+            df['Month'], categories=list(_MONTH_ABBR) + ['Unknown'], ordered=True)
+        return df.sort_values(
+            ['Company', 'Year', 'Month'],
             ascending=[True, False, False]
         )
-        final_df = final_df.drop(columns=['Month_Num'])
-        
-        # Save
-        with pd.ExcelWriter(self.output_file, engine='openpyxl') as writer:
-            final_df.to_excel(writer, sheet_name='Quarterly Sentiment', index=False)
-        
-        logger.info(f"Saved {len(new_results)} new results to {self.output_file}")
+
+    def _write_sidecar(self, df: pd.DataFrame):
+        """Write the Parquet sidecar, tolerating a missing engine."""
+        try:
+            df.to_parquet(self.output_file.with_suffix('.parquet'), compression='zstd')
+        except Exception as e:
+            logger.debug(f"Parquet sidecar write failed: {e}")
+
+    def _write_excel(self, df: pd.DataFrame):
+        """Write the output workbook (xlsxwriter when available)."""
+        try:
+            writer = pd.ExcelWriter(self.output_file, engine='xlsxwriter')
+        except ImportError:
+            writer = pd.ExcelWriter(self.output_file, engine='openpyxl')
+        with writer:
+            df.to_excel(writer, sheet_name='Quarterly Sentiment', index=False)
     
-    def run_incremental(self, max_companies: int = None, callback=None) -> dict:
+    def run_incremental(self, max_companies: int = None, callback=None, force: bool = False) -> dict:
         """
         Run incremental analysis (only new data).
-        
+
         Args:
             max_companies: Maximum number of companies to process
             callback: Function to call with progress updates
-            
+            force: Re-analyze everything and bypass the HTTP cache
+
         Returns:
             Summary dict
         """
@@ -563,8 +1162,13 @@ class AnalysisEngine:
                 companies = companies[:max_companies]
             
             processing_status['total'] = len(companies)
-            all_results = []
-            
+            new_quarters = 0
+            pending = []
+
+            # Fetch every company page concurrently up front; the
+            # per-company loop then only pays for PDF fetch + inference
+            url_map = self.fetcher.get_transcript_urls_bulk(companies, bypass_cache=force)
+
             for i, nse_code in enumerate(companies, 1):
                 processing_status['progress'] = i
                 processing_status['current_company'] = nse_code
@@ -578,40 +1182,41 @@ class AnalysisEngine:
                     })
                 
                 try:
-                    results = self.analyze_company(nse_code, force=False)
+                    results = self.analyze_company(nse_code, force=force,
+                                                   transcripts=url_map.get(nse_code))
                     if results:
-                        all_results.extend(results)
-                        processing_status['logs'].append(
-                            f"[{i}/{len(companies)}] {nse_code}: {len(results)} quarters analyzed"
-                        )
-                        
-                        # Batch save every 10 companies
+                        pending.extend(results)
+                        new_quarters += len(results)
+                        _log_status(f"[{i}/{len(companies)}] {nse_code}: {len(results)} quarters analyzed")
+
+                        # Flush only the slice accumulated since the
+                        # last save (Parquet only; the workbook is
+                        # written once at the end). Re-saving the whole
+                        # run each time made total write volume
+                        # quadratic in the number of companies.
                         if i % 10 == 0:
-                            self.save_results(all_results, mode='append')
-                            # Clear saved results from memory to avoid duplicates if we save again later
-                            # But wait, save_results logic handles deduplication.
-                            # Better approach: keep accumulating but save the snapshot.
+                            self.save_results(pending, mode='append', final=False)
+                            pending = []
                             logger.info(f"Batch save at {i} companies")
-                            
+
                 except Exception as e:
-                    processing_status['logs'].append(f"[{i}/{len(companies)}] {nse_code}: Error - {e}")
-                
-                time.sleep(1.0)  # Increased delay to be polite
-            
-            # Save final results
-            if all_results:
-                self.save_results(all_results, mode='append')
-            
+                    _log_status(f"[{i}/{len(companies)}] {nse_code}: Error - {e}")
+
+            # Save final results (tail flush; earlier batches are already
+            # merged into the cached frame)
+            if pending or new_quarters:
+                self.save_results(pending, mode='append')
+
             # Record run
             self.state_tracker.record_run('incremental', {
                 'companies_processed': len(companies),
-                'new_quarters': len(all_results)
+                'new_quarters': new_quarters
             })
-            
+
             return {
                 'success': True,
                 'companies_processed': len(companies),
-                'new_quarters': len(all_results)
+                'new_quarters': new_quarters
             }
             
         finally:
@@ -624,52 +1229,94 @@ class AnalysisEngine:
         """
         # Clear state
         self.state_tracker.clear_all()
-        
+
         processing_status['mode'] = 'full'
-        return self.run_incremental(max_companies, callback)
+        return self.run_incremental(max_companies, callback, force=True)
     
-    def analyze_local_company(self, company_name: str, local_processor: 'LocalTranscriptProcessor', force: bool = False) -> list:
+    def analyze_local_company(self, company_name: str, local_processor: 'LocalTranscriptProcessor',
+                              force: bool = False, executor: ProcessPoolExecutor = None) -> list:
         """
         Analyze transcripts from local files for a single company.
-        
+
         Args:
             company_name: Company folder name (e.g., "20MICRONS", "TCS")
             local_processor: LocalTranscriptProcessor instance
             force: If True, re-analyze even if already processed
-            
+            executor: Shared extraction pool (run_local_analysis passes
+                one so workers aren't respawned per company); a private
+                pool is created here when omitted
+
         Returns:
             List of result dicts for each quarter
         """
-        results = []
-        
-        # Get company info from manager
-        company_info = self.company_mgr.get_company(company_name)
-        sector = company_info['industry'] if company_info else 'Unknown'
-        
-        # Get local transcripts
+        pending = self._pending_local(company_name, local_processor, force)
+        if not pending:
+            return []
+
+        # PyMuPDF extraction is CPU-bound; fan the PDFs out across
+        # processes when there's more than one to do
+        texts = {}
+        if len(pending) > 1 or executor is not None:
+            try:
+                paths = [str(t['path']) for t in pending]
+                if executor is not None:
+                    extracted = executor.map(_extract_one, paths, chunksize=4)
+                else:
+                    workers = min(os.cpu_count() or 1, len(pending))
+                    with ProcessPoolExecutor(max_workers=workers) as ex:
+                        extracted = list(ex.map(_extract_one, paths, chunksize=4))
+                for transcript, text in zip(pending, extracted):
+                    texts[id(transcript)] = text
+            except Exception as e:
+                logger.error(f"Parallel extraction failed, falling back to serial: {e}")
+                texts = {}
+
+        pairs = []
+        for transcript in pending:
+            # Extract text from local PDF
+            text = texts.get(id(transcript)) or local_processor.extract_text_from_pdf(transcript['path'])
+            if not text or len(text.split()) < 100:
+                logger.debug(f"Insufficient text in {transcript['path']}")
+                continue
+            pairs.append((transcript, text))
+
+        return self._finish_local_company(company_name, pairs)
+
+    def _pending_local(self, company_name: str, local_processor: 'LocalTranscriptProcessor',
+                       force: bool = False) -> list:
+        """Local transcripts for a company that still need analysis."""
         transcripts = local_processor.get_local_transcripts(company_name)
-        
         if not transcripts:
             logger.debug(f"No local transcripts found for {company_name}")
             return []
-        
+
+        # Processed quarters bulk-loaded in one query
+        processed = frozenset() if force else self.state_tracker.get_processed_set(company_name)
+        pending = []
         for transcript in transcripts:
-            quarter = transcript['quarter']
-            
-            # Skip if already processed (unless force)
-            if not force and self.state_tracker.is_processed(company_name, quarter):
-                logger.debug(f"Skipping {company_name} {quarter} (already processed)")
-                continue
-            
-            # Extract text from local PDF
-            text = local_processor.extract_text_from_pdf(transcript['path'])
-            if not text or len(text.split()) < 100:
-                logger.debug(f"Insufficient text in {transcript['path']}")
+            if transcript['quarter'] in processed:
+                logger.debug(f"Skipping {company_name} {transcript['quarter']} (already processed)")
                 continue
-            
-            # Analyze
-            analysis = self.analyzer.analyze_transcript(text)
-            
+            pending.append(transcript)
+        return pending
+
+    def _finish_local_company(self, company_name: str, pairs: list) -> list:
+        """Run inference over (transcript, text) pairs and build results.
+
+        One batched inference pass per company; state marks commit once
+        at the end.
+        """
+        if not pairs:
+            return []
+
+        company_info = self.company_mgr.get_company(company_name)
+        sector = company_info['industry'] if company_info else 'Unknown'
+
+        results = []
+        analyses = self._analyze_many([text for _, text in pairs])
+
+        marks = []
+        for (transcript, _), analysis in zip(pairs, analyses):
             result = {
                 'Company': company_name,
                 'Sector': sector,
@@ -687,15 +1334,14 @@ class AnalysisEngine:
                 'Source': 'local',
                 'Analyzed_At': datetime.now().isoformat()
             }
-            
+
             results.append(result)
-            
-            # Mark as processed
-            self.state_tracker.mark_processed(company_name, quarter, {
-                'sentiment': analysis['overall_sentiment'],
-                'source': 'local'
-            })
-        
+            marks.append((company_name, transcript['quarter'],
+                          {'sentiment': analysis['overall_sentiment'], 'source': 'local'}))
+
+        # One executemany + one commit for the whole company
+        self.state_tracker.mark_batch_processed(marks)
+
         return results
     
     def run_local_analysis(self, pdf_folder: Path = None, max_companies: int = None, 
@@ -732,29 +1378,51 @@ class AnalysisEngine:
             
             processing_status['total'] = len(companies)
             all_results = []
-            
-            for i, company in enumerate(companies, 1):
-                processing_status['progress'] = i
-                processing_status['current_company'] = company
-                
-                if callback:
-                    callback({
-                        'progress': i,
-                        'total': len(companies),
-                        'current': company,
-                        'done': False
-                    })
-                
-                try:
-                    results = self.analyze_local_company(company, local_processor, force=force)
-                    if results:
-                        all_results.extend(results)
-                        processing_status['logs'].append(
-                            f"[{i}/{len(companies)}] {company}: {len(results)} quarters analyzed"
-                        )
-                except Exception as e:
-                    processing_status['logs'].append(f"[{i}/{len(companies)}] {company}: Error - {e}")
-                    logger.error(f"Error analyzing {company}: {e}")
+
+            # One extraction pool for the whole run. Every company's
+            # extractions are submitted up front, so worker processes
+            # parse PDFs ahead while the main thread runs inference on
+            # the current company — CPU extraction and (GPU) FinBERT
+            # overlap instead of alternating.
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as extract_pool:
+                jobs = {}
+                for company in companies:
+                    pending = self._pending_local(company, local_processor, force)
+                    jobs[company] = [(t, extract_pool.submit(_extract_one, str(t['path'])))
+                                     for t in pending]
+
+                for i, company in enumerate(companies, 1):
+                    processing_status['progress'] = i
+                    processing_status['current_company'] = company
+
+                    if callback:
+                        callback({
+                            'progress': i,
+                            'total': len(companies),
+                            'current': company,
+                            'done': False
+                        })
+
+                    try:
+                        pairs = []
+                        for transcript, future in jobs[company]:
+                            try:
+                                text = future.result()
+                            except Exception:
+                                text = ""
+                            text = text or local_processor.extract_text_from_pdf(transcript['path'])
+                            if not text or len(text.split()) < 100:
+                                logger.debug(f"Insufficient text in {transcript['path']}")
+                                continue
+                            pairs.append((transcript, text))
+
+                        results = self._finish_local_company(company, pairs)
+                        if results:
+                            all_results.extend(results)
+                            _log_status(f"[{i}/{len(companies)}] {company}: {len(results)} quarters analyzed")
+                    except Exception as e:
+                        _log_status(f"[{i}/{len(companies)}] {company}: Error - {e}")
+                        logger.error(f"Error analyzing {company}: {e}")
             
             # Save results
             if all_results:
@@ -1098,7 +1766,7 @@ def dashboard():
         sentiment_dist=get_sentiment_distribution(),
         sentiment_changes=get_sentiment_changes(),
         all_companies=get_all_company_list(),
-        processing=processing_status,
+        processing=dict(processing_status),
         last_run=last_run,
         mood=mood,
         mood_color=mood_color
@@ -1143,12 +1811,68 @@ def api_status():
     tracker = get_state_tracker()
     
     return jsonify({
-        'processing': processing_status,
+        'processing': dict(processing_status),
         'run_history': tracker.get_run_history(),
         'summary': tracker.get_summary()
     })
 
 
+def _spawn_and_stream(mode: str, kwargs: dict):
+    """Start the pipeline in a child process and stream its status as SSE.
+
+    The Flask process never runs FinBERT or PDF extraction itself; it
+    polls the shared status dict and forwards progress to the client.
+    """
+    status = _get_status_proxy()
+    status.update({
+        'running': True,
+        'progress': 0,
+        'total': 0,
+        'current_company': '',
+        'mode': mode,
+        'start_time': datetime.now().isoformat(),
+        'logs': [],
+        'result': None,
+    })
+    proc = mp.Process(target=_pipeline_worker, args=(status, mode, kwargs), daemon=True)
+    proc.start()
+
+    def generate():
+        last = None
+        while True:
+            # One proxy round-trip per tick instead of one per field
+            snap = dict(status)
+            snapshot = {
+                'progress': snap.get('progress', 0),
+                'total': snap.get('total', 0),
+                'current': snap.get('current_company', ''),
+                'done': False
+            }
+            if snapshot != last:
+                yield f"data: {_sse_dumps(snapshot)}\n\n"
+                last = snapshot
+            if not snap.get('running', False):
+                break
+            if not proc.is_alive():
+                # The worker died without running its cleanup (OOM kill,
+                # signal); clear the flag ourselves so this stream ends
+                # and later /api/analyze/* calls aren't refused with 409
+                status['running'] = False
+                if not status.get('result'):
+                    status['result'] = {
+                        'success': False,
+                        'error': f'Analysis process exited unexpectedly '
+                                 f'(exit code {proc.exitcode})',
+                    }
+                break
+            time.sleep(0.5)
+        proc.join(timeout=10)
+        result = status.get('result') or {}
+        yield f"data: {_sse_dumps({'done': True, **result})}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream')
+
+
 @app.route('/api/analyze/incremental', methods=['GET', 'POST'])
 def api_analyze_incremental():
     """Run incremental analysis."""
@@ -1156,19 +1880,10 @@ def api_analyze_incremental():
         return jsonify({'error': 'Analysis is not available in serverless mode. Run analysis locally and push the updated Excel file.'}), 503
     if processing_status['running']:
         return jsonify({'error': 'Analysis already running'}), 409
-    
+
     max_companies = request.json.get('max_companies') if request.json else None
-    
-    def generate():
-        engine = get_engine()
-        
-        def callback(status):
-            yield f"data: {json.dumps(status)}\n\n"
-        
-        result = engine.run_incremental(max_companies, callback)
-        yield f"data: {json.dumps({'done': True, **result})}\n\n"
-    
-    return Response(generate(), mimetype='text/event-stream')
+
+    return _spawn_and_stream('incremental', {'max_companies': max_companies})
 
 
 @app.route('/api/analyze/full', methods=['GET', 'POST'])
@@ -1178,19 +1893,10 @@ def api_analyze_full():
         return jsonify({'error': 'Full analysis is not available in serverless mode. Run analysis locally and push the updated Excel file.'}), 503
     if processing_status['running']:
         return jsonify({'error': 'Analysis already running'}), 409
-    
+
     max_companies = request.json.get('max_companies') if request.json else None
-    
-    def generate():
-        engine = get_engine()
-        
-        def callback(status):
-            yield f"data: {json.dumps(status)}\n\n"
-        
-        result = engine.run_full(max_companies, callback)
-        yield f"data: {json.dumps({'done': True, **result})}\n\n"
-    
-    return Response(generate(), mimetype='text/event-stream')
+
+    return _spawn_and_stream('full', {'max_companies': max_companies})
 
 
 @app.route('/api/analyze/local', methods=['POST', 'GET'])
@@ -1211,21 +1917,11 @@ def api_analyze_local():
         force = request.args.get('force', 'false').lower() == 'true'
         pdf_folder = request.args.get('pdf_folder')
     
-    def generate():
-        engine = get_engine()
-        
-        def callback(status):
-            yield f"data: {json.dumps(status)}\n\n"
-        
-        result = engine.run_local_analysis(
-            pdf_folder=Path(pdf_folder) if pdf_folder else None,
-            max_companies=max_companies,
-            force=force,
-            callback=callback
-        )
-        yield f"data: {json.dumps({'done': True, **result})}\n\n"
-    
-    return Response(generate(), mimetype='text/event-stream')
+    return _spawn_and_stream('local', {
+        'pdf_folder': pdf_folder,
+        'max_companies': max_companies,
+        'force': force,
+    })
 
 
 @app.route('/api/upload', methods=['POST'])
@@ -1240,70 +1936,64 @@ def api_upload_pdfs():
     if not files or files[0].filename == '':
         return jsonify({'error': 'No files selected'}), 400
     
-    results = []
     engine = get_engine()
     local_processor = LocalTranscriptProcessor()
-    
-    for file in files:
+
+    def _extract_one_upload(file):
+        """Pull the text out of one upload, straight from memory."""
         if not file.filename.endswith('.pdf'):
-            results.append({
-                'filename': file.filename,
-                'success': False,
-                'error': 'Not a PDF file'
-            })
-            continue
-        
+            return {'filename': file.filename, 'success': False,
+                    'error': 'Not a PDF file'}
         try:
-            # Save temporarily
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-                file.save(tmp.name)
-                tmp_path = Path(tmp.name)
-            
-            # Extract text
-            text = local_processor.extract_text_from_pdf(tmp_path)
-            
+            text = local_processor.extract_text_from_bytes(file.read())
             if not text or len(text.split()) < 50:
-                results.append({
-                    'filename': file.filename,
-                    'success': False,
-                    'error': 'Could not extract text from PDF'
-                })
-                tmp_path.unlink()
-                continue
-            
-            # Analyze
-            analysis = engine.analyzer.analyze_transcript(text)
-            
-            # Extract company name from filename if possible
-            company_name = file.filename.replace('.pdf', '').replace('_', ' ').replace('-', ' ')
-            
-            result = {
-                'filename': file.filename,
-                'success': True,
-                'company': company_name,
-                'overall_sentiment': round(analysis['overall_sentiment'], 3),
-                'category': 'Positive' if analysis['overall_sentiment'] > 0.2 else (
-                    'Negative' if analysis['overall_sentiment'] < -0.1 else 'Neutral'),
-                'finbert_score': round(analysis['finbert_score'], 3),
-                'keyword_sentiment': round(analysis['keyword_sentiment'], 3),
-                'guidance': analysis['guidance'],
-                'risk': round(analysis['risk'], 3),
-                'word_count': len(text.split())
-            }
-            
-            results.append(result)
-            
-            # Clean up temp file
-            tmp_path.unlink()
-            
+                return {'filename': file.filename, 'success': False,
+                        'error': 'Could not extract text from PDF'}
+            return {'filename': file.filename, 'text': text}
         except Exception as e:
-            results.append({
-                'filename': file.filename,
-                'success': False,
-                'error': str(e)
-            })
-    
+            return {'filename': file.filename, 'success': False, 'error': str(e)}
+
+    # Extract all files in parallel (fitz releases the GIL in C), then run
+    # sentiment over the extracted texts as one cached batch
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as ex:
+        extracted = list(ex.map(_extract_one_upload, files))
+
+    pending = [r for r in extracted if 'text' in r]
+    try:
+        analyses = engine._analyze_many([r['text'] for r in pending])
+    except Exception as e:
+        analyses = None
+        batch_error = str(e)
+
+    results = []
+    idx = 0
+    for record in extracted:
+        if 'text' not in record:
+            results.append(record)
+            continue
+        if analyses is None:
+            results.append({'filename': record['filename'], 'success': False,
+                            'error': batch_error})
+            continue
+        analysis = analyses[idx]
+        idx += 1
+        text = record['text']
+        # Extract company name from filename if possible
+        company_name = record['filename'].replace('.pdf', '').replace('_', ' ').replace('-', ' ')
+        results.append({
+            'filename': record['filename'],
+            'success': True,
+            'company': company_name,
+            'overall_sentiment': round(analysis['overall_sentiment'], 3),
+            'category': 'Positive' if analysis['overall_sentiment'] > 0.2 else (
+                'Negative' if analysis['overall_sentiment'] < -0.1 else 'Neutral'),
+            'finbert_score': round(analysis['finbert_score'], 3),
+            'keyword_sentiment': round(analysis['keyword_sentiment'], 3),
+            'guidance': analysis['guidance'],
+            'risk': round(analysis['risk'], 3),
+            'word_count': len(text.split())
+        })
+
     # Calculate summary
     successful = [r for r in results if r.get('success')]
     